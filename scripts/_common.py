@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Shared Scraper Helpers
+Session setup, page fetching and CSV writing used by every chain scraper
+"""
+
+import csv
+import io
+import os
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# Transient failures (rate limiting, gateway errors, dropped connections) are retried with backoff
+RETRY = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+
+
+class Branch(NamedTuple):
+    """One store location; a plain tuple, so it is written to CSV as-is with no per-row key lookups"""
+    name: str
+    address: str
+    phone: str
+    hours: str
+    latitude: str
+    longitude: str
+
+
+def make_session() -> requests.Session:
+    """
+    Create a keep-alive session that sends the scrapers' User-Agent and retries transient failures
+
+    Each scraper keeps its own session, so run_all.py can run them on separate threads.
+    """
+    session = requests.Session()
+    session.headers.update({'User-Agent': USER_AGENT})
+
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=RETRY)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def fetch_html(session: requests.Session, url: str) -> Optional[str]:
+    """
+    Fetch a page as UTF-8 text
+
+    Args:
+        session: Session to send the request through
+        url: URL of the page
+
+    Returns:
+        The page text, or None if the request failed
+    """
+    print(f"Fetching data from {url}...")
+
+    try:
+        response = session.get(url, timeout=15)
+        response.raise_for_status()
+        response.encoding = 'utf-8'
+    except requests.RequestException as e:
+        print(f"Error fetching page: {e}")
+        return None
+
+    return response.text
+
+
+def write_csv(branches: List[Union[Dict[str, str], Branch]], output_file: str, fieldnames: Sequence[str]) -> None:
+    """
+    Save branch data to CSV file
+
+    Args:
+        branches: List of branch dictionaries, or Branch tuples already in fieldnames order
+        output_file: Path to output CSV file
+        fieldnames: Columns to write, in order; missing dictionary fields are left empty
+    """
+    if not branches:
+        print("No data to save")
+        return
+
+    # Ensure output directory exists
+    os.makedirs(os.path.dirname(output_file) or '.', exist_ok=True)
+
+    # Format every row in memory first, then encode once and hand the file a single binary write
+    buf = io.StringIO(newline='')
+    writer = csv.writer(buf)
+    writer.writerow(fieldnames)
+    if isinstance(branches[0], Branch):
+        writer.writerows(branches)
+    else:
+        writer.writerows([branch.get(field, '') for field in fieldnames] for branch in branches)
+
+    try:
+        with open(output_file, 'wb') as csvfile:
+            csvfile.write(buf.getvalue().encode('utf-8'))
+
+        print(f"\nSuccessfully saved {len(branches)} branches to {output_file}")
+    except Exception as e:
+        print(f"Error saving to CSV: {e}")
@@ -5,141 +5,325 @@ Generates business-focused insights and charts from combined supermarket data
 """
 
 import pandas as pd
+import matplotlib
+matplotlib.use('Agg')  # Headless rendering - charts are only written to disk
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 from typing import Dict, List, Tuple
-from scipy.spatial import distance_matrix
+from scipy.spatial import cKDTree
 import os
 import re
+import csv
+import json
+import functools
+from concurrent.futures import ProcessPoolExecutor
 
 # Set style for attractive visualizations
 plt.style.use('seaborn-v0_8-darkgrid')
 sns.set_palette("husl")
 
+DATA_FILE = 'data/combined.csv'
+
+# Columns of combined.csv the analysis reads; name, category_id and google_maps_url are never used.
+# 'type' only exists when bravo.csv was combined, so load_data reads whichever of these are present.
+USECOLS = ['chain', 'address', 'phone', 'hours', 'latitude', 'longitude', 'type']
+
+# Arrow dtypes for USECOLS
+DTYPES = {
+    'chain': 'category',
+    'type': 'category',
+    'address': 'string[pyarrow]',
+    'phone': 'string[pyarrow]',
+    'hours': 'string[pyarrow]',
+    'latitude': 'float64',
+    'longitude': 'float64',
+}
+
 # Create charts directory
 CHARTS_DIR = 'charts'
 os.makedirs(CHARTS_DIR, exist_ok=True)
 
+# Insights saved alongside cached charts (git-ignored)
+INSIGHTS_CACHE_DIR = os.path.join(CHARTS_DIR, '.cache')
+os.makedirs(INSIGHTS_CACHE_DIR, exist_ok=True)
 
-def load_data(file_path: str = 'data/combined.csv') -> pd.DataFrame:
-    """Load and prepare the combined supermarket data"""
-    df = pd.read_csv(file_path, encoding='utf-8')
+# Output resolution for every chart; 150 DPI keeps even the 20x14in map at a README-friendly size
+DPI = 150
 
-    # Convert coordinates to numeric
-    df['latitude'] = pd.to_numeric(df['latitude'], errors='coerce')
-    df['longitude'] = pd.to_numeric(df['longitude'], errors='coerce')
+# Very distinct brand colors for each chain (vivid and clearly different)
+CHAIN_COLORS = {
+    'OBA': '#0066CC',      # Deep Blue
+    'ARAZ': '#FF6600',     # Bright Orange
+    'BRAVO': '#CC0000',    # Red
+    'RAHAT': '#00CC33',    # Green
+    'TAM': '#9933FF'       # Purple
+}
 
-    # Add flag for data completeness
-    df['has_phone'] = df['phone'].notna() & (df['phone'].str.strip() != '')
-    df['has_address'] = df['address'].notna() & (df['address'].str.strip() != '')
-    df['has_hours'] = df['hours'].notna() & (df['hours'].str.strip() != '')
-    df['has_coords'] = df['latitude'].notna() & df['longitude'].notna()
+# Seaborn palettes are recomputed on every call, so cache them by (name, size)
+_PALETTE_CACHE: Dict[Tuple[str, int], List] = {}
 
-    return df
 
+def _palette(name: str, n: int) -> List:
+    """Cached sns.color_palette(name, n)"""
+    if (name, n) not in _PALETTE_CACHE:
+        _PALETTE_CACHE[(name, n)] = sns.color_palette(name, n)
+    return _PALETTE_CACHE[(name, n)]
 
-def infer_city_from_coordinates(lat: float, lon: float) -> str:
-    """Infer city name from coordinates for stores without addresses"""
-    # Major city coordinates (approximate centers)
-    city_coords = {
-        'Bakı': (40.4093, 49.8671),
-        'Sumqayıt': (40.5894, 49.6684),
-        'Gəncə': (40.6828, 46.3606),
-        'Mingəçevir': (40.7639, 47.0497),
-        'Xırdalan': (40.4527, 49.7389),
-        'Şəki': (41.1974, 47.1704),
-        'Naxçıvan': (39.2090, 45.4120),
-        'Şirvan': (39.9369, 48.9200),
-        'Lənkəran': (38.7542, 48.8510),
-        'Qazax': (41.0924, 45.3654),
-        'Zaqatala': (41.6317, 46.6445),
-        'Şamaxı': (40.6304, 48.6389),
-        'Quba': (41.3614, 48.5128),
-        'Masallı': (39.0352, 48.6717),
-    }
 
-    # Find nearest city (within 50km ~0.45 degrees)
-    min_dist = float('inf')
-    nearest_city = 'Bakı'  # Default
+# One Figure per process, cleared and resized for each chart instead of building a new one
+_FIGURE = None
+
+
+def _figure(figsize: Tuple[float, float] = None) -> plt.Figure:
+    """The shared Figure, cleared and reset to rc defaults at the requested size"""
+    global _FIGURE
+    if _FIGURE is None:
+        _FIGURE = plt.figure()
+    fig = _FIGURE
+    fig.clear()
+    fig.set_size_inches(figsize or plt.rcParams['figure.figsize'])
+    fig.set_facecolor(plt.rcParams['figure.facecolor'])
+    fig.set_layout_engine('constrained')
+    return fig
+
+
+def _subplots(nrows: int = 1, ncols: int = 1, figsize: Tuple[float, float] = None, **kwargs):
+    """Like plt.subplots(), but on the shared Figure after clearing it"""
+    fig = _figure(figsize)
+    return fig, fig.subplots(nrows, ncols, **kwargs)
+
+
+def _save(fig: plt.Figure, name: str, dpi: int = DPI, **kwargs) -> None:
+    """Write a chart's PNG to CHARTS_DIR; the Figure itself is kept for the next chart"""
+    fig.savefig(f'{CHARTS_DIR}/{name}', dpi=dpi, **kwargs)
+
+
+def _cached(name: str):
+    """Reuse a chart whose PNG is newer than the data and this script, returning the insight saved with it"""
+    def decorator(chart_func):
+        @functools.wraps(chart_func)
+        def wrapper(df: pd.DataFrame, *args, **kwargs) -> Dict:
+            png = f'{CHARTS_DIR}/{name}.png'
+            insight_file = f'{INSIGHTS_CACHE_DIR}/{name}.json'
+            sources_mtime = max(os.path.getmtime(DATA_FILE), os.path.getmtime(__file__))
+            if (os.path.exists(png) and os.path.exists(insight_file)
+                    and os.path.getmtime(png) >= sources_mtime):
+                with open(insight_file, encoding='utf-8') as f:
+                    return json.load(f)
+
+            # _save writes the PNG synchronously, so it is on disk before the insight is recorded
+            result = chart_func(df, *args, **kwargs)
+            with open(insight_file, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False, indent=2)
+            return result
+        return wrapper
+    return decorator
+
 
-    for city, (city_lat, city_lon) in city_coords.items():
-        dist = np.sqrt((lat - city_lat)**2 + (lon - city_lon)**2)
-        if dist < min_dist:
-            min_dist = dist
-            nearest_city = city
+def _non_blank(s: pd.Series) -> pd.Series:
+    """Whether each string is present and not only whitespace, tested without building stripped copies"""
+    return (s.str.len().gt(0) & ~s.str.isspace()).fillna(False).astype(bool)
 
-    # If too far from any known city (>0.5 degrees ~55km), classify as Bakı if in Greater Baku region
-    if min_dist > 0.5:
-        if 40.1 < lat < 40.7 and 49.5 < lon < 50.5:
-            return 'Bakı'
-        return 'Regional'
 
-    return nearest_city
+def load_data(file_path: str = DATA_FILE) -> pd.DataFrame:
+    """Load and prepare the combined supermarket data"""
+    # The Arrow reader rejects callable usecols and missing columns, so match USECOLS against the header
+    with open(file_path, encoding='utf-8', newline='') as f:
+        header = next(csv.reader(f), [])
+    usecols = [col for col in USECOLS if col in header]
+
+    # Parse only the columns we use, with the Arrow CSV reader and a typed schema
+    df = pd.read_csv(file_path, encoding='utf-8', engine='pyarrow', usecols=usecols,
+                     dtype={col: DTYPES[col] for col in usecols})
+
+    # Add flag for data completeness
+    df['has_phone'] = _non_blank(df['phone'])
+    df['has_address'] = _non_blank(df['address'])
+    df['has_hours'] = _non_blank(df['hours'])
+    df['has_coords'] = df['latitude'].notna() & df['longitude'].notna()
 
+    # Derive city once so every chart reuses the same column
+    df['city'] = assign_cities(df).astype('category')
 
-def extract_city_from_address(row: pd.Series) -> str:
-    """Extract city/region name from address or infer from coordinates"""
-    address = row.get('address', '')
+    return df
 
-    # If no address, use coordinates
-    if pd.isna(address) or str(address).strip() == '':
-        if pd.notna(row.get('latitude')) and pd.notna(row.get('longitude')):
-            return infer_city_from_coordinates(row['latitude'], row['longitude'])
-        return 'Unknown'
 
-    address = str(address)
+def compute_stats(df: pd.DataFrame) -> Dict:
+    """Chain and city aggregates shared by the chart functions, computed once and passed to each chart"""
+    chains = tuple(df['chain'].unique())
+    # Store counts per (city, chain); the per-city and per-chain totals below all derive from it
+    city_chain = df.groupby(['city', 'chain'], observed=True).size().unstack(fill_value=0)
+    present = city_chain > 0
+    return {
+        # Chains in order of first appearance, which also fixes their husl colors
+        'chains': chains,
+        'n_chains': len(chains),
+        # Categories are already sorted, so legends need no per-chart sort
+        'sorted_chains': tuple(df['chain'].cat.categories),
+        'chain_colors': dict(zip(chains, _palette("husl", len(chains)))),
+        # CHAIN_COLORS, with the husl color as fallback for chains it does not list
+        'brand_colors': {chain: CHAIN_COLORS.get(chain, color)
+                         for chain, color in zip(chains, _palette("husl", len(chains)))},
+        'chain_counts': df['chain'].value_counts(),
+        'chain_cities': present.sum(axis=0),
+        'city_chain': city_chain,
+        # Counting every city and dropping the two placeholder categories avoids masking the rows.
+        # Stable sort so cities with equal counts keep alphabetical (category) order
+        'top_cities': (city_chain.sum(axis=1).drop(['Unknown', 'Regional'], errors='ignore')
+                       .sort_values(ascending=False, kind='stable')),
+        'city_diversity': present.sum(axis=1),
+    }
 
-    # Major cities (expanded list)
-    major_cities = ['Bakı', 'Sumqayıt', 'Gəncə', 'Mingəçevir', 'Xırdalan',
-                    'Naxçıvan', 'Şəki', 'Qazax', 'Zaqatala', 'Masallı',
-                    'Ağdaş', 'Şəmkir', 'Bərdə', 'Salyan', 'Ağstafa',
-                    'Hacıqabul', 'Ağcabədi', 'Şərur', 'Cəlilabad', 'Lənkəran',
-                    'Şirvan', 'Quba', 'Şamaxı', 'Yevlax', 'Göyçay']
 
-    for city in major_cities:
-        if city.lower() in address.lower():
-            return city
+def dominant_chains(df: pd.DataFrame) -> pd.DataFrame:
+    """Leading chain per city and its store count (ties go to the chain seen first, as with value_counts)"""
+    counts = df.groupby(['city', 'chain'], sort=False, observed=True).size().rename('count')
+    leaders = counts.sort_values(ascending=False, kind='stable').groupby(level='city', sort=False, observed=True).head(1)
+    return leaders.reset_index(level='chain')
+
+
+# Major city coordinates (approximate centers)
+CITY_COORDS = {
+    'Bakı': (40.4093, 49.8671),
+    'Sumqayıt': (40.5894, 49.6684),
+    'Gəncə': (40.6828, 46.3606),
+    'Mingəçevir': (40.7639, 47.0497),
+    'Xırdalan': (40.4527, 49.7389),
+    'Şəki': (41.1974, 47.1704),
+    'Naxçıvan': (39.2090, 45.4120),
+    'Şirvan': (39.9369, 48.9200),
+    'Lənkəran': (38.7542, 48.8510),
+    'Qazax': (41.0924, 45.3654),
+    'Zaqatala': (41.6317, 46.6445),
+    'Şamaxı': (40.6304, 48.6389),
+    'Quba': (41.3614, 48.5128),
+    'Masallı': (39.0352, 48.6717),
+}
+
+# Nearest-city lookups go through a KD-tree built once over the city centers
+_CITY_TREE = cKDTree(np.array(list(CITY_COORDS.values())))
+_CITY_NAMES = np.array(list(CITY_COORDS.keys()), dtype=object)
+
+
+def infer_city_from_coordinates(lat: float, lon: float) -> str:
+    """Infer city name from coordinates for stores without addresses (single-point infer_city_from_coordinates_vec)"""
+    return infer_city_from_coordinates_vec(np.array([lat]), np.array([lon]))[0]
+
+
+def infer_city_from_coordinates_vec(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """Infer city names from coordinates for stores without addresses, over arrays of latitudes and longitudes"""
+    lats = np.asarray(lats, dtype=float)
+    lons = np.asarray(lons, dtype=float)
+
+    # Nearest city center, with planar distances in degrees
+    dists, idx = _CITY_TREE.query(np.column_stack([lats, lons]), k=1, workers=-1)
+
+    cities = _CITY_NAMES[idx]
+
+    # Too far from any known city (>0.5 degrees): Bakı if in Greater Baku region, else Regional.
+    # Only the far-away rows need the region test, so evaluate it on that subset in place.
+    too_far = np.flatnonzero(dists > 0.5)
+    far_lats, far_lons = lats[too_far], lons[too_far]
+    greater_baku = (far_lats > 40.1) & (far_lats < 40.7) & (far_lons > 49.5) & (far_lons < 50.5)
+    cities[too_far] = np.where(greater_baku, 'Bakı', 'Regional')
+    return cities
+
+
+# Major cities (expanded list)
+MAJOR_CITIES = ['Bakı', 'Sumqayıt', 'Gəncə', 'Mingəçevir', 'Xırdalan',
+                'Naxçıvan', 'Şəki', 'Qazax', 'Zaqatala', 'Masallı',
+                'Ağdaş', 'Şəmkir', 'Bərdə', 'Salyan', 'Ağstafa',
+                'Hacıqabul', 'Ağcabədi', 'Şərur', 'Cəlilabad', 'Lənkəran',
+                'Şirvan', 'Quba', 'Şamaxı', 'Yevlax', 'Göyçay']
+
+# Map districts to cities
+DISTRICT_MAP = {
+    'Nəsimi': 'Bakı', 'Nərimanov': 'Bakı', 'Xətai': 'Bakı',
+    'Yasamal': 'Bakı', 'Səbail': 'Bakı', 'Nizami': 'Bakı',
+    'Binəqədi': 'Bakı', 'Sabunçu': 'Bakı', 'Suraxanı': 'Bakı',
+    'Qaradağ': 'Bakı', 'Xəzər': 'Bakı', 'Abşeron': 'Bakı'
+}
+
+# Common words that precede "şəh"/"qəs" but are not settlement names
+SETTLEMENT_STOPWORDS = ['Yeni', 'Köhnə', 'Birinci', 'İkinci', 'Böyük', 'Kiçik']
+
+BAKU_KEYWORDS = ['metrosu', 'metro', 'prospekt', 'pr.']
+
+# One alternation over the lowercased city names, scanned against the lowercased address.
+# Case-sensitive on purpose: re.IGNORECASE folds 'ı' and 'i' together, Series.str.lower() does not.
+# On string[pyarrow] data lower() is Arrow's utf8_lower, which maps 'İ' to a plain 'i' (Python's
+# str.lower() gives 'i̇'), so uppercase addresses like 'ŞİRVAN' match 'şirvan' as well.
+# Longest names first so a city can never be shadowed by a shorter name it starts with;
+# priority between matches still follows MAJOR_CITIES order via _CITY_RANK.
+_CITY_RE = re.compile('(' + '|'.join(re.escape(city.lower())
+                                     for city in sorted(MAJOR_CITIES, key=len, reverse=True)) + ')')
+_CITY_RANK = {city.lower(): rank for rank, city in enumerate(MAJOR_CITIES)}
+
+_RAYON_RE = re.compile(r'(\w+)\s+(ray|rayonu)', re.IGNORECASE)
+_SETTLEMENT_RE = re.compile(r'(\w+)\s+(şəh|şəhəri|qəs|qəsəbəsi)', re.IGNORECASE)
+
+
+def assign_cities(df: pd.DataFrame) -> pd.Series:
+    """Extract city/region name from address or infer from coordinates (vectorized over all rows)"""
+    # Stays string[pyarrow], so the .str methods below run as Arrow compute kernels
+    address = df['address'].fillna('')
+    addr_lower = address.str.lower()
+    has_address = (address.str.strip() != '').to_numpy(dtype=bool)
+    has_coords = (df['latitude'].notna() & df['longitude'].notna()).to_numpy()
+
+    # Major cities - one regex pass finds every mention, the earliest in MAJOR_CITIES wins
+    rank = addr_lower.str.extractall(_CITY_RE)[0].map(_CITY_RANK).groupby(level=0).min().reindex(df.index)
+    major_city = np.where(rank.notna(), np.array(MAJOR_CITIES, dtype=object)[rank.fillna(0).astype(int)], '')
 
     # Try to extract rayonu (district)
-    rayon_match = re.search(r'(\w+)\s+(ray|rayonu)', address, re.IGNORECASE)
-    if rayon_match:
-        district = rayon_match.group(1).capitalize()
-        # Map districts to cities
-        district_map = {
-            'Nəsimi': 'Bakı', 'Nərimanov': 'Bakı', 'Xətai': 'Bakı',
-            'Yasamal': 'Bakı', 'Səbail': 'Bakı', 'Nizami': 'Bakı',
-            'Binəqədi': 'Bakı', 'Sabunçu': 'Bakı', 'Suraxanı': 'Bakı',
-            'Qaradağ': 'Bakı', 'Xəzər': 'Bakı', 'Abşeron': 'Bakı'
-        }
-        return district_map.get(district, district)
-
-    # Try to extract settlement
-    settlement_match = re.search(r'(\w+)\s+(şəh|şəhəri|qəs|qəsəbəsi)', address, re.IGNORECASE)
-    if settlement_match:
-        city_name = settlement_match.group(1).capitalize()
-        # Filter out common words
-        if city_name not in ['Yeni', 'Köhnə', 'Birinci', 'İkinci', 'Böyük', 'Kiçik']:
-            return city_name
+    district = address.str.extract(_RAYON_RE, expand=True)[0].str.capitalize()
+    district = district.mask(district.isin(DISTRICT_MAP.keys()), district.map(DISTRICT_MAP))
 
-    # Default to Baku if contains common Baku keywords
-    baku_keywords = ['metrosu', 'metro', 'prospekt', 'pr.']
-    if any(kw in address.lower() for kw in baku_keywords):
-        return 'Bakı'
+    # Try to extract settlement, filtering out common words
+    settlement = address.str.extract(_SETTLEMENT_RE, expand=True)[0].str.capitalize()
+    settlement_ok = settlement.notna() & ~settlement.isin(SETTLEMENT_STOPWORDS)
 
-    # Last resort: use coordinates if available
-    if pd.notna(row.get('latitude')) and pd.notna(row.get('longitude')):
-        return infer_city_from_coordinates(row['latitude'], row['longitude'])
+    # Default to Baku if contains common Baku keywords
+    baku_kw = np.logical_or.reduce([addr_lower.str.contains(kw, regex=False).to_numpy(dtype=bool)
+                                    for kw in BAKU_KEYWORDS])
+
+    conditions = [
+        ~has_address & has_coords,
+        ~has_address,
+        major_city != '',
+        district.notna().to_numpy(),
+        settlement_ok.to_numpy(dtype=bool),
+        baku_kw,
+        has_coords,
+    ]
 
-    return 'Regional'
+    # Rows that end up on the coordinate fallback (no address, or no address rule matched)
+    use_coords = np.select(conditions, [True, False, False, False, False, False, True], default=False)
+    coord_city = np.full(len(df), None, dtype=object)
+    lats = df['latitude'].to_numpy()[use_coords]
+    lons = df['longitude'].to_numpy()[use_coords]
+    coord_city[use_coords] = infer_city_from_coordinates_vec(lats, lons)
+
+    choices = [
+        coord_city,
+        'Unknown',
+        major_city.astype(object),
+        district.to_numpy(dtype=object),
+        settlement.to_numpy(dtype=object),
+        'Bakı',
+        coord_city,
+    ]
+    return pd.Series(np.select(conditions, choices, default='Regional'), index=df.index, name='city')
 
 
-def chart_1_market_share(df: pd.DataFrame) -> Dict:
+@_cached('01_market_share')
+def chart_1_market_share(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 1: Market Share by Chain"""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig, ax = _subplots(figsize=(10, 6))
 
-    chain_counts = df['chain'].value_counts().sort_values(ascending=True)
-    colors = sns.color_palette("husl", len(chain_counts))
+    chain_counts = stats['chain_counts'].iloc[::-1]  # Ascending, largest bar on top
+    colors = _palette("husl", len(chain_counts))
 
     bars = ax.barh(chain_counts.index, chain_counts.values, color=colors, edgecolor='black', linewidth=1.5)
 
@@ -155,9 +339,7 @@ def chart_1_market_share(df: pd.DataFrame) -> Dict:
     ax.set_title('Market Share by Supermarket Chain', fontsize=14, fontweight='bold', pad=20)
     ax.grid(axis='x', alpha=0.3, linestyle='--')
 
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/01_market_share.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, '01_market_share.png')
 
     return {
         'title': 'Market Share Analysis',
@@ -165,65 +347,61 @@ def chart_1_market_share(df: pd.DataFrame) -> Dict:
     }
 
 
-def chart_2_geographic_distribution(df: pd.DataFrame) -> Dict:
+@_cached('02_geographic_distribution')
+def chart_2_geographic_distribution(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 2: City-Level Market Share Map (Bubble Chart)"""
-    df['city'] = df.apply(extract_city_from_address, axis=1)
-
     # Filter to valid cities and get top 20 by store count
-    valid_df = df[~df['city'].isin(['Unknown', 'Regional'])].copy()
-    top_20_cities = valid_df['city'].value_counts().head(20).index
-
-    city_data = []
-    for city in top_20_cities:
-        city_df = df[df['city'] == city]
-
-        # Get coordinates (average for the city)
-        lat = city_df['latitude'].mean()
-        lon = city_df['longitude'].mean()
-
-        # Get dominant chain
-        chain_counts = city_df['chain'].value_counts()
-        dominant_chain = chain_counts.index[0]
-        dominant_pct = (chain_counts.iloc[0] / len(city_df)) * 100
-
-        city_data.append({
-            'City': city,
-            'Latitude': lat,
-            'Longitude': lon,
-            'Total Stores': len(city_df),
-            'Dominant Chain': dominant_chain,
-            'Dominance %': dominant_pct,
-            'Num Chains': city_df['chain'].nunique()
-        })
-
-    city_df_plot = pd.DataFrame(city_data)
+    top_20_cities = stats['top_cities'].head(20).index
+
+    # One grouped pass for coordinates (average for the city), size and chain count
+    agg = df.groupby('city', observed=True).agg(total=('chain', 'size'), num_chains=('chain', 'nunique'),
+                                 lat=('latitude', 'mean'), lon=('longitude', 'mean')).reindex(top_20_cities)
+
+    # Get dominant chain
+    dominant = dominant_chains(df).reindex(top_20_cities)
+
+    city_df_plot = pd.DataFrame({
+        'City': top_20_cities,
+        'Latitude': agg['lat'].to_numpy(),
+        'Longitude': agg['lon'].to_numpy(),
+        'Total Stores': agg['total'].to_numpy(),
+        'Dominant Chain': dominant['chain'].to_numpy(),
+        'Dominance %': (dominant['count'] / agg['total'] * 100).to_numpy(),
+        'Num Chains': agg['num_chains'].to_numpy()
+    })
 
     # Create figure
-    fig, ax = plt.subplots(figsize=(16, 12))
+    fig, ax = _subplots(figsize=(16, 12))
 
     # Assign colors by dominant chain
-    chain_colors = {chain: color for chain, color in zip(df['chain'].unique(), sns.color_palette("husl", df['chain'].nunique()))}
-    colors = [chain_colors[chain] for chain in city_df_plot['Dominant Chain']]
+    chain_colors = stats['chain_colors']
+    colors = city_df_plot['Dominant Chain'].map(chain_colors).to_numpy()
 
     # Create bubble chart - size by total stores
     scatter = ax.scatter(city_df_plot['Longitude'], city_df_plot['Latitude'],
                         s=city_df_plot['Total Stores']*3,  # Size by store count
                         c=colors, alpha=0.7,
-                        edgecolors='black', linewidth=2)
+                        edgecolors='black', linewidth=2, rasterized=True)
 
     # Add city labels with store count
-    for idx, row in city_df_plot.iterrows():
-        label = f"{row['City']}\n{int(row['Total Stores'])} stores"
-        if row['Num Chains'] == 1:
+    cities = city_df_plot['City'].to_numpy()
+    lons = city_df_plot['Longitude'].to_numpy()
+    lats = city_df_plot['Latitude'].to_numpy()
+    stores = city_df_plot['Total Stores'].to_numpy()
+    num_chains = city_df_plot['Num Chains'].to_numpy()
+
+    # Alternate label offsets to avoid overlap
+    positions = np.arange(len(cities))
+    off_x = np.where(positions % 2 == 0, 0.05, -0.05)
+    off_y = np.where(positions % 3 == 0, 0.03, -0.03)
+    for i in range(len(cities)):
+        label = f"{cities[i]}\n{int(stores[i])} stores"
+        if num_chains[i] == 1:
             label += "\n(Monopoly)"
 
-        # Position label to avoid overlap
-        offset_x = 0.05 if idx % 2 == 0 else -0.05
-        offset_y = 0.03 if idx % 3 == 0 else -0.03
-
         ax.annotate(label,
-                   (row['Longitude'], row['Latitude']),
-                   xytext=(offset_x, offset_y), textcoords='offset fontsize',
+                   (lons[i], lats[i]),
+                   xytext=(off_x[i], off_y[i]), textcoords='offset fontsize',
                    fontsize=8, fontweight='bold',
                    bbox=dict(boxstyle='round,pad=0.4', facecolor='white', alpha=0.8, edgecolor='gray'),
                    ha='center')
@@ -235,7 +413,7 @@ def chart_2_geographic_distribution(df: pd.DataFrame) -> Dict:
 
     # Create legend for chains
     legend_elements = [plt.scatter([], [], s=100, c=chain_colors[chain], edgecolors='black', linewidth=2, label=chain)
-                      for chain in df['chain'].unique()]
+                      for chain in stats['chains']]
     ax.legend(handles=legend_elements, title='Dominant Chain',
              loc='upper right', framealpha=0.95, fontsize=10, title_fontsize=11)
 
@@ -249,9 +427,7 @@ def chart_2_geographic_distribution(df: pd.DataFrame) -> Dict:
     size_legend = ax.legend(loc='lower left', framealpha=0.95, fontsize=9, title='Store Count Scale', title_fontsize=10)
     ax.add_artist(size_legend)
 
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/02_geographic_distribution.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, '02_geographic_distribution.png')
 
     return {
         'title': 'Geographic Market Map',
@@ -259,37 +435,41 @@ def chart_2_geographic_distribution(df: pd.DataFrame) -> Dict:
     }
 
 
-def chart_3_market_concentration(df: pd.DataFrame) -> Dict:
+@_cached('03_market_concentration')
+def chart_3_market_concentration(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 3: Market Concentration Index (Herfindahl-Hirschman Index)"""
-    df['city'] = df.apply(extract_city_from_address, axis=1)
-
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig, ax = _subplots(figsize=(14, 8))
 
     # Calculate HHI for top 15 cities
     top_cities = df['city'].value_counts().head(15).index
 
-    hhi_data = []
-    for city in top_cities:
-        city_df = df[df['city'] == city]
-        market_shares = city_df['chain'].value_counts() / len(city_df)
-        hhi = (market_shares ** 2).sum() * 10000  # HHI scale
-        total_stores = len(city_df)
-        num_chains = city_df['chain'].nunique()
-        hhi_data.append({'City': city, 'HHI': hhi, 'Stores': total_stores, 'Chains': num_chains})
+    # Market shares of every chain in every city from a single grouped count
+    counts = df.groupby(['city', 'chain'], observed=True).size()
+    shares = counts / counts.groupby(level='city', observed=True).transform('sum')
+
+    # Store total, chain count and HHI per city in one aggregation
+    city_totals = pd.DataFrame({'Stores': counts, 'Chains': 1, 'HHI': (shares ** 2) * 10000})  # HHI scale
+    city_totals = city_totals.groupby(level='city', observed=True).sum().reindex(top_cities)
 
-    hhi_df = pd.DataFrame(hhi_data).sort_values('HHI', ascending=False)
+    hhi_df = pd.DataFrame({
+        'City': top_cities,
+        'HHI': city_totals['HHI'].to_numpy(),
+        'Stores': city_totals['Stores'].to_numpy(),
+        'Chains': city_totals['Chains'].to_numpy()
+    }).sort_values('HHI', ascending=False)
 
     # Color based on market concentration
-    colors = ['#e74c3c' if hhi > 5000 else '#f39c12' if hhi > 2500 else '#2ecc71' for hhi in hhi_df['HHI']]
+    hhi_values = hhi_df['HHI'].to_numpy()
+    colors = np.select([hhi_values > 5000, hhi_values > 2500], ['#e74c3c', '#f39c12'], default='#2ecc71')
 
-    bars = ax.barh(range(len(hhi_df)), hhi_df['HHI'], color=colors, edgecolor='black', linewidth=1)
+    ax.barh(range(len(hhi_df)), hhi_df['HHI'], color=colors, edgecolor='black', linewidth=1)
     ax.set_yticks(range(len(hhi_df)))
     ax.set_yticklabels(hhi_df['City'])
 
     # Add value labels and store count
-    for i, (idx, row) in enumerate(hhi_df.iterrows()):
-        ax.text(row['HHI'] + 100, i,
-                f"HHI: {row['HHI']:.0f} | {row['Stores']} stores | {row['Chains']} chains",
+    for i, (hhi, stores, chains) in enumerate(zip(hhi_values, hhi_df['Stores'].to_numpy(), hhi_df['Chains'].to_numpy())):
+        ax.text(hhi + 100, i,
+                f"HHI: {hhi:.0f} | {stores} stores | {chains} chains",
                 va='center', fontsize=9, fontweight='bold')
 
     # Add reference lines
@@ -303,9 +483,7 @@ def chart_3_market_concentration(df: pd.DataFrame) -> Dict:
     ax.grid(axis='x', alpha=0.3, linestyle='--')
     ax.invert_yaxis()
 
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/03_market_concentration.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, '03_market_concentration.png')
 
     monopoly_cities = hhi_df[hhi_df['HHI'] >= 10000]
     return {
@@ -315,17 +493,14 @@ def chart_3_market_concentration(df: pd.DataFrame) -> Dict:
     }
 
 
-def chart_4_top_cities(df: pd.DataFrame) -> Dict:
+@_cached('04_top_cities')
+def chart_4_top_cities(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 4: Top 15 Cities by Store Count"""
-    df['city'] = df.apply(extract_city_from_address, axis=1)
+    fig, ax = _subplots(figsize=(12, 8))
 
     # Exclude generic categories
-    valid_cities = df[~df['city'].isin(['Unknown', 'Regional'])].copy()
-
-    fig, ax = plt.subplots(figsize=(12, 8))
-
-    top_cities = valid_cities['city'].value_counts().head(15)
-    colors = sns.color_palette("viridis", len(top_cities))
+    top_cities = stats['top_cities'].head(15)
+    colors = _palette("viridis", len(top_cities))
 
     bars = ax.barh(range(len(top_cities)), top_cities.values, color=colors, edgecolor='black', linewidth=1)
     ax.set_yticks(range(len(top_cities)))
@@ -344,9 +519,7 @@ def chart_4_top_cities(df: pd.DataFrame) -> Dict:
     ax.grid(axis='x', alpha=0.3, linestyle='--')
     ax.invert_yaxis()
 
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/04_top_cities.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, '04_top_cities.png')
 
     return {
         'title': 'City Rankings',
@@ -354,20 +527,17 @@ def chart_4_top_cities(df: pd.DataFrame) -> Dict:
     }
 
 
-def chart_5_chain_by_city(df: pd.DataFrame) -> Dict:
+@_cached('05_chain_by_city')
+def chart_5_chain_by_city(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 5: Chain Competition in Major Cities (Grouped Horizontal)"""
-    if 'city' not in df.columns:
-        df['city'] = df.apply(extract_city_from_address, axis=1)
-
-    fig, ax = plt.subplots(figsize=(14, 10))
+    fig, ax = _subplots(figsize=(14, 10))
 
     # Top 12 cities
-    top_cities = df[~df['city'].isin(['Unknown', 'Regional'])]['city'].value_counts().head(12).index
-    city_chain_data = df[df['city'].isin(top_cities)].groupby(['city', 'chain']).size().unstack(fill_value=0)
+    top_cities = stats['top_cities'].head(12).index
+    city_chain_data = stats['city_chain'].loc[top_cities].loc[:, lambda d: d.any()]  # Only chains present here
 
     # Reorder by total stores
-    city_chain_data['Total'] = city_chain_data.sum(axis=1)
-    city_chain_data = city_chain_data.sort_values('Total', ascending=True).drop('Total', axis=1)
+    city_chain_data = city_chain_data.loc[city_chain_data.sum(axis=1).sort_values(ascending=True).index]
 
     city_chain_data.plot(kind='barh', stacked=False, ax=ax, width=0.75, edgecolor='black', linewidth=0.5)
 
@@ -378,9 +548,7 @@ def chart_5_chain_by_city(df: pd.DataFrame) -> Dict:
     ax.legend(title='Chain', bbox_to_anchor=(1.02, 1), loc='upper left', framealpha=0.95)
     ax.grid(axis='x', alpha=0.3, linestyle='--')
 
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/05_chain_by_city.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, '05_chain_by_city.png')
 
     return {
         'title': 'Urban Competition',
@@ -388,54 +556,50 @@ def chart_5_chain_by_city(df: pd.DataFrame) -> Dict:
     }
 
 
-def chart_6_competitive_intensity(df: pd.DataFrame) -> Dict:
+@_cached('06_competitive_intensity')
+def chart_6_competitive_intensity(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 6: Competitive Intensity Analysis - Cleaner Version"""
-    if 'city' not in df.columns:
-        df['city'] = df.apply(extract_city_from_address, axis=1)
-
-    fig, ax = plt.subplots(figsize=(16, 10))
+    fig, ax = _subplots(figsize=(16, 10))
 
     # Calculate competitive metrics for top 12 cities only (reduce crowding)
-    top_cities = df[~df['city'].isin(['Unknown', 'Regional'])]['city'].value_counts().head(12).index
-
-    comp_data = []
-    for city in top_cities:
-        city_df = df[df['city'] == city]
-        total_stores = len(city_df)
-        num_chains = city_df['chain'].nunique()
-        stores_per_chain = total_stores / num_chains if num_chains > 0 else 0
-        intensity = total_stores / (num_chains ** 2) if num_chains > 0 else 0
-
-        comp_data.append({
-            'City': city,
-            'Stores': total_stores,
-            'Chains': num_chains,
-            'Stores per Chain': stores_per_chain,
-            'Intensity': intensity
-        })
-
-    comp_df = pd.DataFrame(comp_data).sort_values('Stores', ascending=False)
+    top_cities = stats['top_cities'].head(12).index
+
+    agg = df.groupby('city', observed=True).agg(total=('chain', 'size'), num_chains=('chain', 'nunique')).reindex(top_cities)
+    total_stores = agg['total'].to_numpy()
+    num_chains = agg['num_chains'].to_numpy()
+
+    comp_df = pd.DataFrame({
+        'City': top_cities,
+        'Stores': total_stores,
+        'Chains': num_chains,
+        'Stores per Chain': total_stores / num_chains,
+        'Intensity': total_stores / (num_chains ** 2)
+    }).sort_values('Stores', ascending=False)
 
     # Create bubble chart with better spacing
     scatter = ax.scatter(comp_df['Chains'], comp_df['Stores'],
                         s=comp_df['Stores per Chain']*8,
                         c=comp_df['Intensity'], cmap='RdYlGn_r',
-                        alpha=0.75, edgecolors='black', linewidth=2.5)
+                        alpha=0.75, edgecolors='black', linewidth=2.5, rasterized=True)
 
     # Add city labels with smart positioning using adjustText-style logic
     from matplotlib import patheffects
-    for idx, row in comp_df.iterrows():
-        # Offset based on position to reduce overlap
-        if row['Stores'] > 500:
-            xytext = (10, 10)
-        elif row['Stores'] > 200:
-            xytext = (-30, -15) if row['Chains'] > 3 else (10, -15)
-        else:
-            xytext = (8, -20) if idx % 2 == 0 else (-35, 8)
-
-        text = ax.annotate(f"{row['City']}\n({int(row['Stores'])} stores, {int(row['Chains'])} chains)",
-                          (row['Chains'], row['Stores']),
-                          xytext=xytext, textcoords='offset points',
+    all_stores = comp_df['Stores'].to_numpy()
+    all_chains = comp_df['Chains'].to_numpy()
+    even = comp_df.index.to_numpy() % 2 == 0
+
+    # Offset based on position to reduce overlap
+    tiers = [all_stores > 500,
+             (all_stores > 200) & (all_chains > 3),
+             all_stores > 200,
+             even]
+    off_x = np.select(tiers, [10, -30, 10, 8], default=-35)
+    off_y = np.select(tiers, [10, -15, -15, -20], default=8)
+
+    for i, (city, stores, chains) in enumerate(zip(comp_df['City'].to_numpy(), all_stores, all_chains)):
+        text = ax.annotate(f"{city}\n({int(stores)} stores, {int(chains)} chains)",
+                          (chains, stores),
+                          xytext=(off_x[i], off_y[i]), textcoords='offset points',
                           fontsize=9, fontweight='bold',
                           bbox=dict(boxstyle='round,pad=0.5', facecolor='white', alpha=0.85, edgecolor='gray', linewidth=1),
                           arrowprops=dict(arrowstyle='->', connectionstyle='arc3,rad=0.3', color='gray', lw=1.5))
@@ -469,9 +633,7 @@ def chart_6_competitive_intensity(df: pd.DataFrame) -> Dict:
     # Legend for reference
     ax.legend(loc='lower right', framealpha=0.9, fontsize=10)
 
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/06_competitive_intensity.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, '06_competitive_intensity.png')
 
     return {
         'title': 'Competition Landscape',
@@ -479,55 +641,47 @@ def chart_6_competitive_intensity(df: pd.DataFrame) -> Dict:
     }
 
 
-def chart_7_market_opportunity(df: pd.DataFrame) -> Dict:
+@_cached('07_market_opportunity')
+def chart_7_market_opportunity(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 7: Market Opportunity Map - Top 15 Cities Only"""
-    if 'city' not in df.columns:
-        df['city'] = df.apply(extract_city_from_address, axis=1)
-
-    fig, ax = plt.subplots(figsize=(14, 10))
+    fig, ax = _subplots(figsize=(14, 10))
 
     # Top 15 cities only to avoid crowding
-    top_cities = df[~df['city'].isin(['Unknown', 'Regional'])]['city'].value_counts().head(15).index
+    top_cities = stats['top_cities'].head(15).index
 
-    opp_data = []
-    for city in top_cities:
-        city_df = df[df['city'] == city]
-        total_stores = len(city_df)
-        num_chains = city_df['chain'].nunique()
+    agg = df.groupby('city', observed=True).agg(total=('chain', 'size'), num_chains=('chain', 'nunique')).reindex(top_cities)
 
+    opp_df = pd.DataFrame({
+        'City': top_cities,
+        'Total Stores': agg['total'].to_numpy(),
+        'Active Chains': agg['num_chains'].to_numpy(),
         # Opportunity score: More stores but fewer chains = higher opportunity
-        opportunity_score = (total_stores / 100) - num_chains
-
-        opp_data.append({
-            'City': city,
-            'Total Stores': total_stores,
-            'Active Chains': num_chains,
-            'Opportunity Score': opportunity_score
-        })
-
-    opp_df = pd.DataFrame(opp_data).sort_values('Opportunity Score', ascending=False)  # Best opportunities at top
+        'Opportunity Score': agg['total'].to_numpy() / 100 - agg['num_chains'].to_numpy()
+    }).sort_values('Opportunity Score', ascending=False)  # Best opportunities at top
 
     # Color: Green = high opportunity, Red = saturated
-    colors = ['#2ecc71' if score > 0 else '#e74c3c' for score in opp_df['Opportunity Score']]
+    colors = np.where(opp_df['Opportunity Score'].to_numpy() > 0, '#2ecc71', '#e74c3c')
 
-    bars = ax.barh(range(len(opp_df)), opp_df['Opportunity Score'],
-                   color=colors, edgecolor='black', linewidth=2)
+    ax.barh(range(len(opp_df)), opp_df['Opportunity Score'],
+            color=colors, edgecolor='black', linewidth=2)
     ax.set_yticks(range(len(opp_df)))
     ax.set_yticklabels(opp_df['City'], fontsize=11, fontweight='bold')
 
     # Add labels with better positioning
-    for i, (idx, row) in enumerate(opp_df.iterrows()):
-        score = row['Opportunity Score']
+    scores = opp_df['Opportunity Score'].to_numpy()
+    stores = opp_df['Total Stores'].to_numpy()
+    chains = opp_df['Active Chains'].to_numpy()
+    for i, (score, total_stores, num_chains) in enumerate(zip(scores, stores, chains)):
         if score > 0:
             # Positive scores - label on right
             ax.text(score + 0.15, i,
-                    f"{int(row['Total Stores'])} stores, {int(row['Active Chains'])} chains  ",
+                    f"{int(total_stores)} stores, {int(num_chains)} chains  ",
                     va='center', ha='left', fontsize=9, fontweight='bold',
                     bbox=dict(boxstyle='round,pad=0.3', facecolor='lightgreen', alpha=0.3))
         else:
             # Negative scores - label on left
             ax.text(score - 0.15, i,
-                    f"  {int(row['Total Stores'])} stores, {int(row['Active Chains'])} chains",
+                    f"  {int(total_stores)} stores, {int(num_chains)} chains",
                     va='center', ha='right', fontsize=9, fontweight='bold',
                     bbox=dict(boxstyle='round,pad=0.3', facecolor='lightcoral', alpha=0.3))
 
@@ -549,9 +703,7 @@ def chart_7_market_opportunity(df: pd.DataFrame) -> Dict:
                 fontsize=14, fontweight='bold', pad=20)
     ax.grid(axis='x', alpha=0.25, linestyle='--')
 
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/07_market_opportunity.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, '07_market_opportunity.png')
 
     best_opp = opp_df.iloc[0]  # Top ranked opportunity
 
@@ -563,27 +715,22 @@ def chart_7_market_opportunity(df: pd.DataFrame) -> Dict:
     }
 
 
-def chart_8_chain_comparison(df: pd.DataFrame) -> Dict:
+@_cached('08_chain_comparison')
+def chart_8_chain_comparison(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 8: Chain Performance Metrics"""
-    if 'city' not in df.columns:
-        df['city'] = df.apply(extract_city_from_address, axis=1)
-
-    fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+    fig, axes = _subplots(1, 3, figsize=(18, 6))
 
-    chains = df['chain'].unique()
-    metrics = []
+    chains = list(stats['chains'])
+    stores = stats['chain_counts'].reindex(chains).to_numpy()
+    cities = stats['chain_cities'].reindex(chains).to_numpy()
 
-    for chain in chains:
-        chain_df = df[df['chain'] == chain]
-        metrics.append({
-            'Chain': chain,
-            'Stores': len(chain_df),
-            'Cities': chain_df['city'].nunique(),
-            'Avg per City': len(chain_df) / chain_df['city'].nunique()
-        })
-
-    metrics_df = pd.DataFrame(metrics)
-    colors = sns.color_palette("husl", len(chains))
+    metrics_df = pd.DataFrame({
+        'Chain': chains,
+        'Stores': stores,
+        'Cities': cities,
+        'Avg per City': stores / cities
+    })
+    colors = _palette("husl", len(chains))
 
     # Store count
     axes[0].bar(metrics_df['Chain'], metrics_df['Stores'], color=colors, edgecolor='black', linewidth=2)
@@ -609,10 +756,8 @@ def chart_8_chain_comparison(df: pd.DataFrame) -> Dict:
     for i, v in enumerate(metrics_df['Avg per City']):
         axes[2].text(i, v + 1, f'{v:.1f}', ha='center', fontweight='bold')
 
-    plt.suptitle('Chain Performance Comparison', fontsize=15, fontweight='bold', y=1.02)
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/08_chain_comparison.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    plt.suptitle('Chain Performance Comparison', fontsize=15, fontweight='bold')
+    _save(fig, '08_chain_comparison.png')
 
     return {
         'title': 'Chain Metrics',
@@ -620,23 +765,19 @@ def chart_8_chain_comparison(df: pd.DataFrame) -> Dict:
     }
 
 
-def chart_9_regional_distribution(df: pd.DataFrame) -> Dict:
+@_cached('09_regional_distribution')
+def chart_9_regional_distribution(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 9: Regional Market Share"""
-    if 'city' not in df.columns:
-        df['city'] = df.apply(extract_city_from_address, axis=1)
-
-    fig, ax = plt.subplots(figsize=(12, 8))
+    fig, ax = _subplots(figsize=(12, 8))
 
     # Clean data - exclude Unknown/Regional
-    valid_df = df[~df['city'].isin(['Unknown', 'Regional'])].copy()
-
-    city_counts = valid_df['city'].value_counts()
+    city_counts = stats['top_cities']
     top_8 = city_counts.head(8)
     others = city_counts[8:].sum()
 
     plot_data = pd.concat([top_8, pd.Series({'Other Cities': others})])
 
-    colors = sns.color_palette("Set3", len(plot_data))
+    colors = _palette("Set3", len(plot_data))
 
     def autopct_format(pct):
         return f'{pct:.1f}%' if pct > 3 else ''
@@ -652,25 +793,26 @@ def chart_9_regional_distribution(df: pd.DataFrame) -> Dict:
 
     ax.set_title('Geographic Distribution of Stores', fontsize=14, fontweight='bold', pad=20)
 
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/09_regional_distribution.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, '09_regional_distribution.png')
 
     return {
         'title': 'Regional Breakdown',
         'insight': f"Bakı holds {plot_data.iloc[0]/plot_data.sum()*100:.1f}% of market. "
-                  f"Top 8 cities = {top_8.sum()/valid_df.shape[0]*100:.1f}% of stores"
+                  f"Top 8 cities = {top_8.sum()/city_counts.sum()*100:.1f}% of stores"
     }
 
 
-def chart_10_latitude_distribution(df: pd.DataFrame) -> Dict:
+@_cached('10_latitude_distribution')
+def chart_10_latitude_distribution(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 10: North-South Geographic Spread"""
-    fig, ax = plt.subplots(figsize=(12, 6))
+    fig, ax = _subplots(figsize=(12, 6))
 
-    df_coords = df[df['has_coords']].copy()
+    df_coords = df[df['has_coords']]
 
-    chains = sorted(df_coords['chain'].unique())
-    data_to_plot = [df_coords[df_coords['chain'] == chain]['latitude'].values for chain in chains]
+    # One partitioning pass instead of a mask per chain
+    lat_by_chain = {chain: lats.to_numpy() for chain, lats in df_coords.groupby('chain', observed=True)['latitude']}
+    chains = sorted(lat_by_chain)
+    data_to_plot = [lat_by_chain[chain] for chain in chains]
 
     bp = ax.boxplot(data_to_plot, labels=chains, patch_artist=True, widths=0.6,
                     showmeans=True, meanline=True,
@@ -689,9 +831,7 @@ def chart_10_latitude_distribution(df: pd.DataFrame) -> Dict:
     # Add legend
     ax.legend([bp['medians'][0], bp['means'][0]], ['Median', 'Mean'], loc='upper right')
 
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/10_latitude_distribution.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, '10_latitude_distribution.png')
 
     return {
         'title': 'Geographic Coverage',
@@ -699,12 +839,10 @@ def chart_10_latitude_distribution(df: pd.DataFrame) -> Dict:
     }
 
 
-def chart_11_store_saturation(df: pd.DataFrame) -> Dict:
+@_cached('11_market_saturation')
+def chart_11_store_saturation(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 11: Market Saturation Analysis - Stores per 10k people estimate"""
-    if 'city' not in df.columns:
-        df['city'] = df.apply(extract_city_from_address, axis=1)
-
-    fig, ax = plt.subplots(figsize=(14, 8))
+    fig, ax = _subplots(figsize=(14, 8))
 
     # Approximate population estimates for major cities (in thousands)
     population_estimates = {
@@ -722,32 +860,29 @@ def chart_11_store_saturation(df: pd.DataFrame) -> Dict:
         'Yevlax': 65,
     }
 
-    saturation_data = []
-    for city, pop in population_estimates.items():
-        city_stores = len(df[df['city'] == city])
-        if city_stores > 0:
-            stores_per_10k = (city_stores / pop) * 10
-            saturation_data.append({
-                'City': city,
-                'Stores': city_stores,
-                'Pop (k)': pop,
-                'Stores per 10k': stores_per_10k
-            })
+    # Store counts for the estimated cities come straight from the shared city counts
+    pop = pd.Series(population_estimates)
+    city_stores = stats['top_cities'].reindex(pop.index, fill_value=0)
+    present = city_stores.to_numpy() > 0
 
-    sat_df = pd.DataFrame(saturation_data).sort_values('Stores per 10k', ascending=True)
+    sat_df = pd.DataFrame({
+        'City': pop.index[present],
+        'Stores': city_stores.to_numpy()[present],
+        'Pop (k)': pop.to_numpy()[present],
+        'Stores per 10k': (city_stores / pop * 10).to_numpy()[present]
+    }).sort_values('Stores per 10k', ascending=True)
 
     # Color by saturation level
-    colors = ['#e74c3c' if x > 6 else '#f39c12' if x > 3 else '#2ecc71' for x in sat_df['Stores per 10k']]
+    vals = sat_df['Stores per 10k'].to_numpy()
+    colors = np.array(['#2ecc71', '#f39c12', '#e74c3c'])[np.digitize(vals, [3, 6], right=True)]
 
     bars = ax.barh(range(len(sat_df)), sat_df['Stores per 10k'], color=colors, edgecolor='black', linewidth=1.5)
     ax.set_yticks(range(len(sat_df)))
     ax.set_yticklabels(sat_df['City'], fontsize=11, fontweight='bold')
 
     # Add labels
-    for i, (idx, row) in enumerate(sat_df.iterrows()):
-        ax.text(row['Stores per 10k'] + 0.2, i,
-                f"{row['Stores per 10k']:.1f} ({row['Stores']} stores)",
-                va='center', fontsize=9, fontweight='bold')
+    ax.bar_label(bars, labels=[f"{x:.1f} ({stores} stores)" for x, stores in zip(vals, sat_df['Stores'].to_numpy())],
+                 padding=3, fontsize=9, fontweight='bold')
 
     ax.set_xlabel('Stores per 10,000 Population (Estimated)', fontsize=12, fontweight='bold')
     ax.set_title('Market Saturation Analysis by City\n(Green = Underserved, Red = Saturated)',
@@ -760,9 +895,7 @@ def chart_11_store_saturation(df: pd.DataFrame) -> Dict:
     ax.axvline(avg_saturation, color='blue', linestyle='--', linewidth=2, alpha=0.7, label=f'Average: {avg_saturation:.1f}')
     ax.legend()
 
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/11_market_saturation.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, '11_market_saturation.png')
 
     underserved = sat_df[sat_df['Stores per 10k'] < avg_saturation].iloc[0] if len(sat_df[sat_df['Stores per 10k'] < avg_saturation]) > 0 else None
 
@@ -777,17 +910,18 @@ def chart_11_store_saturation(df: pd.DataFrame) -> Dict:
     }
 
 
-def chart_12_store_format_mix(df: pd.DataFrame) -> Dict:
+@_cached('12_store_format_mix')
+def chart_12_store_format_mix(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 12: Store Format Distribution (Bravo)"""
     bravo_df = df[df['chain'] == 'BRAVO'].copy()
 
     if 'type' not in bravo_df.columns or bravo_df['type'].isna().all():
         return None
 
-    fig, ax = plt.subplots(figsize=(10, 7))
+    fig, ax = _subplots(figsize=(10, 7))
 
-    type_counts = bravo_df['type'].value_counts()
-    colors = sns.color_palette("pastel", len(type_counts))
+    type_counts = bravo_df['type'].value_counts().loc[lambda c: c > 0]  # Drop other chains' formats
+    colors = _palette("pastel", len(type_counts))
 
     # Create bar chart instead of pie to avoid overlapping
     bars = ax.bar(range(len(type_counts)), type_counts.values, color=colors, edgecolor='black', linewidth=1.5)
@@ -795,20 +929,15 @@ def chart_12_store_format_mix(df: pd.DataFrame) -> Dict:
     ax.set_xticklabels(type_counts.index, rotation=45, ha='right', fontsize=10)
 
     # Add value labels
-    for i, (bar, count) in enumerate(zip(bars, type_counts.values)):
-        height = bar.get_height()
-        pct = (count / type_counts.sum()) * 100
-        ax.text(bar.get_x() + bar.get_width()/2, height + 1,
-                f'{count}\n({pct:.1f}%)',
-                ha='center', va='bottom', fontsize=10, fontweight='bold')
+    pcts = type_counts.to_numpy() / type_counts.sum() * 100
+    ax.bar_label(bars, labels=[f'{count}\n({pct:.1f}%)' for count, pct in zip(type_counts.to_numpy(), pcts)],
+                 padding=3, fontsize=10, fontweight='bold')
 
     ax.set_ylabel('Number of Stores', fontsize=12, fontweight='bold')
     ax.set_title('Bravo Store Format Distribution', fontsize=14, fontweight='bold', pad=20)
     ax.grid(axis='y', alpha=0.3, linestyle='--')
 
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/12_store_format_mix.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, '12_store_format_mix.png')
 
     return {
         'title': 'Format Strategy',
@@ -816,60 +945,54 @@ def chart_12_store_format_mix(df: pd.DataFrame) -> Dict:
     }
 
 
-def chart_13_chain_territory(df: pd.DataFrame) -> Dict:
+@_cached('13_chain_territory')
+def chart_13_chain_territory(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 13: Chain Territorial Dominance - Fixed Labels"""
-    if 'city' not in df.columns:
-        df['city'] = df.apply(extract_city_from_address, axis=1)
-
-    fig, ax = plt.subplots(figsize=(16, 10))
+    fig, ax = _subplots(figsize=(16, 10))
 
     # Top 12 cities only to reduce crowding
-    top_cities = df[~df['city'].isin(['Unknown', 'Regional'])]['city'].value_counts().head(12).index
-
-    territory_data = []
-    for city in top_cities:
-        city_df = df[df['city'] == city]
-        chain_counts = city_df['chain'].value_counts()
-        dominant_chain = chain_counts.index[0]
-        dominant_count = chain_counts.iloc[0]
-        total = len(city_df)
-        dominance = (dominant_count / total) * 100
-
-        territory_data.append({
-            'City': city,
-            'Dominant Chain': dominant_chain,
-            'Market Share': dominance,
-            'Stores': dominant_count,
-            'Total': total
-        })
-
-    terr_df = pd.DataFrame(territory_data).sort_values('Market Share', ascending=True)
+    top_cities = stats['top_cities'].head(12).index
+
+    # Leading chain per city from the shared (city, chain) counts
+    dominant = dominant_chains(df).reindex(top_cities)
+    totals = stats['top_cities'].reindex(top_cities)
+
+    terr_df = pd.DataFrame({
+        'City': top_cities,
+        'Dominant Chain': dominant['chain'].to_numpy(),
+        'Market Share': (dominant['count'] / totals * 100).to_numpy(),
+        'Stores': dominant['count'].to_numpy(),
+        'Total': totals.to_numpy()
+    }).sort_values('Market Share', ascending=True)
 
     # Color by dominant chain
-    chain_colors = {chain: color for chain, color in zip(df['chain'].unique(), sns.color_palette("husl", df['chain'].nunique()))}
-    colors = [chain_colors[chain] for chain in terr_df['Dominant Chain']]
+    chain_colors = stats['brand_colors']
+    colors = terr_df['Dominant Chain'].map(chain_colors).to_numpy()
 
-    bars = ax.barh(range(len(terr_df)), terr_df['Market Share'], color=colors, edgecolor='black', linewidth=2)
+    ax.barh(range(len(terr_df)), terr_df['Market Share'], color=colors, edgecolor='black', linewidth=2)
     ax.set_yticks(range(len(terr_df)))
     ax.set_yticklabels(terr_df['City'], fontsize=12, fontweight='bold')
 
     # Add labels - positioned INSIDE bars to avoid overlap
-    for i, (idx, row) in enumerate(terr_df.iterrows()):
+    for i, (share, chain, stores, total) in enumerate(zip(terr_df['Market Share'].to_numpy(),
+                                                          terr_df['Dominant Chain'].to_numpy(),
+                                                          terr_df['Stores'].to_numpy(),
+                                                          terr_df['Total'].to_numpy())):
         # Position text inside the bar if long enough, otherwise outside
-        if row['Market Share'] > 15:
+        if share > 15:
             # Inside bar - white text
-            ax.text(row['Market Share'] / 2, i,
-                    f"{row['Dominant Chain']}: {row['Market Share']:.0f}%",
+            ax.text(share / 2, i,
+                    f"{chain}: {share:.0f}%",
                     va='center', ha='center', fontsize=10, fontweight='bold', color='white',
                     bbox=dict(boxstyle='round,pad=0.4', facecolor='black', alpha=0.6))
         else:
             # Outside bar - black text
-            ax.text(row['Market Share'] + 2, i,
-                    f"{row['Dominant Chain']}: {row['Market Share']:.0f}%",
+            ax.text(share + 2, i,
+                    f"{chain}: {share:.0f}%",
                     va='center', ha='left', fontsize=9, fontweight='bold')
 
         # Add store count at the end
-        ax.text(103, i, f"{int(row['Stores'])}/{int(row['Total'])}",
+        ax.text(103, i, f"{int(stores)}/{int(total)}",
                 va='center', ha='left', fontsize=8, style='italic')
 
     ax.set_xlabel('Market Share of Dominant Chain (%)', fontsize=13, fontweight='bold')
@@ -881,13 +1004,11 @@ def chart_13_chain_territory(df: pd.DataFrame) -> Dict:
 
     # Add legend for chains
     handles = [plt.Rectangle((0,0),1,1, color=chain_colors[chain], edgecolor='black', linewidth=1.5)
-               for chain in sorted(df['chain'].unique())]
-    ax.legend(handles, sorted(df['chain'].unique()), title='Dominant Chain',
+               for chain in stats['sorted_chains']]
+    ax.legend(handles, stats['sorted_chains'], title='Dominant Chain',
              loc='lower right', framealpha=0.95, fontsize=10)
 
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/13_chain_territory.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, '13_chain_territory.png')
 
     monopolies = terr_df[terr_df['Market Share'] == 100]
     return {
@@ -896,55 +1017,34 @@ def chart_13_chain_territory(df: pd.DataFrame) -> Dict:
     }
 
 
-def chart_14_overall_summary(df: pd.DataFrame) -> Dict:
+@_cached('14_overall_summary')
+def chart_14_overall_summary(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 14: Executive Summary Dashboard"""
-    if 'city' not in df.columns:
-        df['city'] = df.apply(extract_city_from_address, axis=1)
-
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    # Text-only dashboard, so the 2x2 panels are placed in figure coordinates with no Axes to draw
+    fig = _figure(figsize=(14, 10))
     fig.patch.set_facecolor('#f0f0f0')
 
-    # Total stores
-    axes[0, 0].text(0.5, 0.5, f"{len(df):,}",
-                   ha='center', va='center', fontsize=60, fontweight='bold', color='#3498db')
-    axes[0, 0].text(0.5, 0.2, "Total Stores",
-                   ha='center', va='center', fontsize=16, fontweight='bold')
-    axes[0, 0].set_facecolor('white')
-    axes[0, 0].axis('off')
-
-    # Market leader
-    top_chain = df['chain'].value_counts().index[0]
-    top_pct = (df['chain'].value_counts().iloc[0] / len(df)) * 100
-    axes[0, 1].text(0.5, 0.5, f"{top_chain}",
-                   ha='center', va='center', fontsize=40, fontweight='bold', color='#e74c3c')
-    axes[0, 1].text(0.5, 0.2, f"Market Leader ({top_pct:.0f}%)",
-                   ha='center', va='center', fontsize=14, fontweight='bold')
-    axes[0, 1].set_facecolor('white')
-    axes[0, 1].axis('off')
-
-    # Cities covered
-    cities = df[~df['city'].isin(['Unknown', 'Regional'])]['city'].nunique()
-    axes[1, 0].text(0.5, 0.5, f"{cities}",
-                   ha='center', va='center', fontsize=60, fontweight='bold', color='#2ecc71')
-    axes[1, 0].text(0.5, 0.2, "Cities Covered",
-                   ha='center', va='center', fontsize=16, fontweight='bold')
-    axes[1, 0].set_facecolor('white')
-    axes[1, 0].axis('off')
-
-    # Average stores per city
+    top_chain = stats['chain_counts'].index[0]
+    top_pct = (stats['chain_counts'].iloc[0] / len(df)) * 100
+    cities = len(stats['top_cities'])
     avg_per_city = len(df) / cities if cities > 0 else 0
-    axes[1, 1].text(0.5, 0.5, f"{avg_per_city:.0f}",
-                   ha='center', va='center', fontsize=60, fontweight='bold', color='#f39c12')
-    axes[1, 1].text(0.5, 0.2, "Avg Stores per City",
-                   ha='center', va='center', fontsize=16, fontweight='bold')
-    axes[1, 1].set_facecolor('white')
-    axes[1, 1].axis('off')
-
-    plt.suptitle('Azerbaijan Supermarket Market - Executive Summary',
+
+    # (value, value size, color, caption, caption size) for each panel, left to right, top to bottom
+    panels = [
+        (f"{len(df):,}", 60, '#3498db', "Total Stores", 16),
+        (f"{top_chain}", 40, '#e74c3c', f"Market Leader ({top_pct:.0f}%)", 14),
+        (f"{cities}", 60, '#2ecc71', "Cities Covered", 16),
+        (f"{avg_per_city:.0f}", 60, '#f39c12', "Avg Stores per City", 16),
+    ]
+    centers = [(0.253, 0.72), (0.747, 0.72), (0.253, 0.245), (0.747, 0.245)]
+
+    for (x, y), (value, value_size, color, caption, caption_size) in zip(centers, panels):
+        fig.text(x, y, value, ha='center', va='center', fontsize=value_size, fontweight='bold', color=color)
+        fig.text(x, y - 0.138, caption, ha='center', va='center', fontsize=caption_size, fontweight='bold')
+
+    fig.suptitle('Azerbaijan Supermarket Market - Executive Summary',
                  fontsize=16, fontweight='bold', y=0.98)
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/14_overall_summary.png', dpi=300, bbox_inches='tight', facecolor='#f0f0f0')
-    plt.close()
+    _save(fig, '14_overall_summary.png', facecolor='#f0f0f0')
 
     return {
         'title': 'Market Overview',
@@ -952,22 +1052,19 @@ def chart_14_overall_summary(df: pd.DataFrame) -> Dict:
     }
 
 
-def chart_15_growth_potential(df: pd.DataFrame) -> Dict:
+@_cached('15_growth_potential')
+def chart_15_growth_potential(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 15: Growth Potential Matrix - Fixed Labels"""
-    if 'city' not in df.columns:
-        df['city'] = df.apply(extract_city_from_address, axis=1)
-
-    fig, ax = plt.subplots(figsize=(16, 10))
+    fig, ax = _subplots(figsize=(16, 10))
 
     # Top 12 cities only to reduce crowding
-    top_12_cities = df[~df['city'].isin(['Unknown', 'Regional'])]['city'].value_counts().head(12).index
-
-    city_diversity = df.groupby('city')['chain'].nunique()
+    top_12 = stats['top_cities'].head(12)
 
+    # Store and chain counts both come from the shared per-city aggregates
     city_data = pd.DataFrame({
-        'Store Count': df[df['city'].isin(top_12_cities)]['city'].value_counts(),
-        'Chain Count': city_diversity[top_12_cities]
-    }).fillna(0)
+        'Store Count': top_12,
+        'Chain Count': stats['city_diversity'].reindex(top_12.index)
+    })
 
     # Create scatter plot
     scatter = ax.scatter(city_data['Chain Count'], city_data['Store Count'],
@@ -976,18 +1073,20 @@ def chart_15_growth_potential(df: pd.DataFrame) -> Dict:
                         cmap='RdYlGn_r', edgecolors='black', linewidth=2)
 
     # Add city labels with smart positioning to avoid overlap
-    for idx, (city, row) in enumerate(city_data.iterrows()):
+    for idx, (city, store_count, chain_count) in enumerate(zip(city_data.index.to_numpy(),
+                                                               city_data['Store Count'].to_numpy(),
+                                                               city_data['Chain Count'].to_numpy())):
         # Smart offset based on position and index to reduce overlap
-        if row['Store Count'] > 800:
+        if store_count > 800:
             # Very high stores (Bakı) - label above right
             xytext = (15, 20)
-        elif row['Store Count'] > 300:
+        elif store_count > 300:
             # High stores - alternate positions
-            if row['Chain Count'] > 4:
+            if chain_count > 4:
                 xytext = (10, -25)  # Top right quadrant - label below
             else:
                 xytext = (-60, 15)  # Top left quadrant - label left
-        elif row['Store Count'] > 100:
+        elif store_count > 100:
             # Medium stores - varied positions
             if idx % 3 == 0:
                 xytext = (12, 8)
@@ -999,7 +1098,7 @@ def chart_15_growth_potential(df: pd.DataFrame) -> Dict:
             # Low stores - alternate sides
             xytext = (10, 10) if idx % 2 == 0 else (-55, -5)
 
-        ax.annotate(city, (row['Chain Count'], row['Store Count']),
+        ax.annotate(city, (chain_count, store_count),
                    xytext=xytext, textcoords='offset points',
                    fontsize=9, fontweight='bold',
                    bbox=dict(boxstyle='round,pad=0.4', facecolor='white', alpha=0.8, edgecolor='gray'),
@@ -1028,16 +1127,15 @@ def chart_15_growth_potential(df: pd.DataFrame) -> Dict:
     cbar = plt.colorbar(scatter, ax=ax)
     cbar.set_label('Stores per Chain (Higher = More Concentrated)', fontsize=10, fontweight='bold')
 
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/15_growth_potential.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, '15_growth_potential.png')
 
     # Find best opportunity
-    low_competition = city_data[(city_data['Chain Count'] < median_chains) & (city_data['Store Count'] > median_stores)]
+    low_competition = (city_data['Chain Count'] < median_chains) & (city_data['Store Count'] > median_stores)
 
-    if len(low_competition) > 0:
-        best = low_competition.idxmax()['Store Count']
-        insight = f"Best opportunity: {best} - high stores ({int(city_data.loc[best, 'Store Count'])}), low competition ({int(city_data.loc[best, 'Chain Count'])} chains)"
+    if low_competition.any():
+        best = city_data.loc[low_competition, 'Store Count'].idxmax()
+        best_stores, best_chains = city_data.loc[best, ['Store Count', 'Chain Count']]
+        insight = f"Best opportunity: {best} - high stores ({int(best_stores)}), low competition ({int(best_chains)} chains)"
     else:
         insight = "Competitive balance across major cities - focus on underserved secondary markets"
 
@@ -1047,40 +1145,26 @@ def chart_15_growth_potential(df: pd.DataFrame) -> Dict:
     }
 
 
-def chart_16_azerbaijan_map(df: pd.DataFrame) -> Dict:
+@_cached('16_azerbaijan_map')
+def chart_16_azerbaijan_map(df: pd.DataFrame, stats: Dict) -> Dict:
     """Chart 16: Azerbaijan Geographic Map - All Supermarket Locations"""
-    fig, ax = plt.subplots(figsize=(20, 14))
-
-    # Filter stores with valid coordinates
-    df_coords = df[df['has_coords']].copy()
-
-    # Define very distinct colors for each chain (vivid and clearly different)
-    distinct_colors = {
-        'OBA': '#0066CC',      # Deep Blue
-        'ARAZ': '#FF6600',     # Bright Orange
-        'BRAVO': '#CC0000',    # Red
-        'RAHAT': '#00CC33',    # Green
-        'TAM': '#9933FF'       # Purple
-    }
+    fig, ax = _subplots(figsize=(20, 14))
 
-    # Map colors to chains
-    chain_colors = {}
-    for chain in df['chain'].unique():
-        chain_colors[chain] = distinct_colors.get(chain, '#808080')  # Gray as fallback
+    # Filter stores with valid coordinates (read-only, so no copy)
+    df_coords = df[df['has_coords']]
 
-    colors = [chain_colors[chain] for chain in df_coords['chain']]
+    chain_colors = stats['brand_colors']
+    colors = df_coords['chain'].map(chain_colors).to_numpy()  # Maps the categories, not every row
 
-    # Create scatter plot with larger dots
-    scatter = ax.scatter(df_coords['longitude'], df_coords['latitude'],
-                        c=colors, alpha=0.7, s=50, edgecolors='black', linewidth=0.8)
+    # Create scatter plot with larger dots; single precision is plenty for pixel placement
+    scatter = ax.scatter(df_coords['longitude'].to_numpy(np.float32), df_coords['latitude'].to_numpy(np.float32),
+                        c=colors, alpha=0.7, s=50, edgecolors='black', linewidth=0.8, rasterized=True)
 
     # Set Azerbaijan geographic bounds
     ax.set_xlim(44.5, 51.0)  # Longitude range for Azerbaijan
     ax.set_ylim(38.2, 42.0)  # Latitude range for Azerbaijan
 
     # City labels removed for cleaner visualization
-    if 'city' not in df.columns:
-        df['city'] = df.apply(extract_city_from_address, axis=1)
 
     # Set labels and title
     ax.set_xlabel('Longitude (°E)', fontsize=14, fontweight='bold')
@@ -1093,9 +1177,10 @@ def chart_16_azerbaijan_map(df: pd.DataFrame) -> Dict:
     ax.set_aspect('equal', adjustable='box')
 
     # Create legend for chains
+    coord_counts = df_coords['chain'].value_counts()
     legend_elements = []
-    for chain in sorted(df['chain'].unique()):
-        chain_count = len(df_coords[df_coords['chain'] == chain])
+    for chain in stats['sorted_chains']:
+        chain_count = coord_counts[chain]
         legend_elements.append(
             plt.scatter([], [], s=100, c=[chain_colors[chain]], edgecolors='black', linewidth=1.5,
                        label=f'{chain} ({chain_count} stores)')
@@ -1114,9 +1199,7 @@ def chart_16_azerbaijan_map(df: pd.DataFrame) -> Dict:
            verticalalignment='bottom', horizontalalignment='right',
            bbox=dict(boxstyle='round', facecolor='white', alpha=0.95, edgecolor='black', linewidth=2.5))
 
-    plt.tight_layout()
-    plt.savefig(f'{CHARTS_DIR}/16_azerbaijan_map.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    _save(fig, '16_azerbaijan_map.png')
 
     return {
         'title': 'Geographic Coverage',
@@ -1124,10 +1207,9 @@ def chart_16_azerbaijan_map(df: pd.DataFrame) -> Dict:
     }
 
 
-def generate_insights_report(df: pd.DataFrame, all_insights: List[Dict]) -> str:
+def generate_insights_report(df: pd.DataFrame, stats: Dict, all_insights: List[Dict]) -> str:
     """Generate business-focused insights report"""
-    df['city'] = df.apply(extract_city_from_address, axis=1)
-    valid_cities = df[~df['city'].isin(['Unknown', 'Regional'])]
+    city_counts = stats['top_cities']
 
     report = []
     report.append("# Business Insights - Azerbaijan Supermarket Market\n")
@@ -1135,27 +1217,27 @@ def generate_insights_report(df: pd.DataFrame, all_insights: List[Dict]) -> str:
     # Executive Summary
     report.append("## Executive Summary")
     report.append(f"- **Market Size**: {len(df):,} supermarket locations")
-    report.append(f"- **Active Chains**: {df['chain'].nunique()} major competitors")
-    report.append(f"- **Geographic Reach**: {valid_cities['city'].nunique()} cities/regions")
-    report.append(f"- **Market Leader**: {df['chain'].value_counts().index[0]} ({df['chain'].value_counts().iloc[0]/len(df)*100:.1f}% share)\n")
+    report.append(f"- **Active Chains**: {stats['n_chains']} major competitors")
+    report.append(f"- **Geographic Reach**: {len(city_counts)} cities/regions")
+    report.append(f"- **Market Leader**: {stats['chain_counts'].index[0]} ({stats['chain_counts'].iloc[0]/len(df)*100:.1f}% share)\n")
 
     # Market Concentration
     report.append("## Market Structure")
-    chain_counts = df['chain'].value_counts()
+    chain_counts = stats['chain_counts']
     for i, (chain, count) in enumerate(chain_counts.items(), 1):
         report.append(f"{i}. **{chain}**: {count:,} stores ({count/len(df)*100:.1f}%)")
     report.append("")
 
     # Geographic Insights
     report.append("## Geographic Patterns")
-    top_5 = valid_cities['city'].value_counts().head(5)
+    top_5 = city_counts.head(5)
     report.append(f"- **Baku Dominance**: {top_5.iloc[0]:,} stores ({top_5.iloc[0]/len(df)*100:.1f}% of total)")
     report.append(f"- **Urban Concentration**: Top 5 cities = {top_5.sum()/len(df)*100:.1f}% of market")
-    report.append(f"- **Regional Presence**: {valid_cities['city'].nunique()} distinct markets served\n")
+    report.append(f"- **Regional Presence**: {len(city_counts)} distinct markets served\n")
 
     # Competition
     report.append("## Competitive Landscape")
-    city_chains = df.groupby('city')['chain'].nunique()
+    city_chains = stats['city_diversity']
     monopoly_cities = city_chains[city_chains == 1]
     competitive_cities = city_chains[city_chains >= 3]
     report.append(f"- **Monopoly Markets**: {len(monopoly_cities)} cities (single chain)")
@@ -1173,6 +1255,25 @@ def generate_insights_report(df: pd.DataFrame, all_insights: List[Dict]) -> str:
     return "\n".join(report)
 
 
+# Dataset and its shared stats for the chart workers. main() sets them before starting the
+# pool so forked workers inherit them; spawned workers load their own copy in _init_worker.
+_WORKER_DF = None
+_WORKER_STATS = None
+
+
+def _init_worker(file_path: str) -> None:
+    """Load the dataset and compute its stats once in each chart worker process, unless inherited"""
+    global _WORKER_DF, _WORKER_STATS
+    if _WORKER_DF is None:
+        _WORKER_DF = load_data(file_path)
+        _WORKER_STATS = compute_stats(_WORKER_DF)
+
+
+def _run_chart(name: str) -> Dict:
+    """Render a single chart (looked up by function name) in a worker process"""
+    return globals()[name](_WORKER_DF, _WORKER_STATS)
+
+
 def main():
     """Main analysis execution"""
     print("=" * 60)
@@ -1181,8 +1282,9 @@ def main():
     print("=" * 60)
     print("\nLoading data...")
 
-    df = load_data()
-    print(f"Loaded {len(df):,} stores from {df['chain'].nunique()} chains\n")
+    df = load_data(DATA_FILE)
+    stats = compute_stats(df)
+    print(f"Loaded {len(df):,} stores from {stats['n_chains']} chains\n")
 
     print("Generating business-focused charts...\n")
 
@@ -1208,15 +1310,22 @@ def main():
         chart_16_azerbaijan_map
     ]
 
-    for i, chart_func in enumerate(chart_functions, 1):
-        try:
-            print(f"  [{i}/{len(chart_functions)}] {chart_func.__name__}...")
-            result = chart_func(df)
-            if result:
-                insights.append(result)
-                print(f"      ✓ {result['insight']}")
-        except Exception as e:
-            print(f"      ✗ Error: {e}")
+    # Charts are independent and each writes its own PNG, so render them in parallel
+    global _WORKER_DF, _WORKER_STATS
+    _WORKER_DF, _WORKER_STATS = df, stats
+    max_workers = min(len(chart_functions), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(DATA_FILE,)) as ex:
+        futures = [ex.submit(_run_chart, chart_func.__name__) for chart_func in chart_functions]
+
+        for i, (chart_func, future) in enumerate(zip(chart_functions, futures), 1):
+            try:
+                print(f"  [{i}/{len(chart_functions)}] {chart_func.__name__}...")
+                result = future.result()
+                if result:
+                    insights.append(result)
+                    print(f"      ✓ {result['insight']}")
+            except Exception as e:
+                print(f"      ✗ Error: {e}")
 
     print(f"\n✓ Generated {len(insights)} business charts")
 
@@ -4,11 +4,48 @@ Araz Market Web Scraper
 Extracts branch locations and details from arazmarket.az
 """
 
-import csv
-import requests
+import functools
+import json
+import re
 from bs4 import BeautifulSoup
+import soupsieve as sv
 from typing import List, Dict
-import os
+from _common import fetch_html, make_session, write_csv
+
+
+# One keep-alive session for every request this scraper makes
+_SESSION = make_session()
+
+# Payload of each self.__next_f.push([index, data]) call in the page
+_PUSH_RE = re.compile(r'self\.__next_f\.push\((\[.*?\])\)')
+
+# Store objects with coordinates: id, title, address, work_time, phone_number, lat, lon
+_STORE_RE = re.compile(r'\{"id":(\d+),"title":"([^"]+)","address":"([^"]+)","work_time":"([^"]+)","phone_number":"([^"]+)","lat":"([^"]+)","lon":"([^"]+)"[^}]*\}')
+
+# CSS selectors for the HTML fallback, compiled once (soupsieve is BeautifulSoup's own CSS engine)
+_ACCORDION_SEL = sv.compile('div.accardion_accardionItem__Fyf_W')
+_TITLE_SEL = sv.compile('div.accardion_accardionTitleToggle___WyGP span')
+_CONTENT_SEL = sv.compile('div.accardion_accardionContent__Vlwtt')
+_OPTIONS_SEL = sv.compile('div.page_list_option__Cq36k')
+_PHONE_SEL = sv.compile('a[href^="tel:"]')
+
+
+def first_value(store: dict, *keys: str) -> str:
+    """
+    Return the first non-empty value among a store's alias keys
+
+    Args:
+        store: Store object from __NEXT_DATA__
+        keys: Alias keys to try, in order
+
+    Returns:
+        The first non-empty value, or an empty string
+    """
+    for key in keys:
+        value = store.get(key)
+        if value:
+            return value
+    return ''
 
 
 def scrape_araz_locations(url: str = "https://arazmarket.az/az/stores") -> List[Dict[str, str]]:
@@ -21,65 +58,49 @@ def scrape_araz_locations(url: str = "https://arazmarket.az/az/stores") -> List[
     Returns:
         List of dictionaries containing branch information
     """
-    print(f"Fetching data from {url}...")
-
-    try:
-        response = requests.get(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        response.raise_for_status()
-        response.encoding = 'utf-8'
-    except requests.RequestException as e:
-        print(f"Error fetching page: {e}")
+    page = fetch_html(_SESSION, url)
+    if page is None:
         return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
     branches = []
 
-    # Check for Next.js data
-    import json
-    import re
-
     # Look for Next.js RSC (React Server Components) streaming data
     # The data is embedded in self.__next_f.push() calls
     print("\nExtracting data from Next.js streaming format...")
 
-    # Find all self.__next_f.push() calls in the HTML
-    push_pattern = r'self\.__next_f\.push\((\[.*?\])\)'
-    matches = re.findall(push_pattern, response.text)
+    # Parse each self.__next_f.push() call in the HTML as it is found and look for store data
+    stores_found = []
+    seen = set()  # (name, address) of stores already collected
+    chunks_scanned = 0
 
-    print(f"Found {len(matches)} data chunks")
+    for match in _PUSH_RE.finditer(page):
+        chunks_scanned += 1
+        raw = match.group(1)
 
-    # Parse each chunk and look for store data
-    stores_found = []
+        # Only chunks mentioning phone_number can hold store data, so skip decoding the rest
+        if 'phone_number' not in raw:
+            continue
 
-    for match in matches:
         try:
             # Parse the array [index, data]
-            chunk = json.loads(match)
+            chunk = json.loads(raw)
             if len(chunk) >= 2:
                 data_str = chunk[1]
 
-                # Check if this chunk contains store data
-                if isinstance(data_str, str) and ('"title"' in data_str and '"address"' in data_str and '"phone_number"' in data_str):
+                # Check if this chunk contains store data; _STORE_RE itself requires the title and address
+                if isinstance(data_str, str) and '"phone_number"' in data_str:
                     # This looks like store data
                     # Try to extract JSON objects from the string
                     # The data might be escaped JSON within a string
 
-                    # Look for store objects pattern with coordinates
-                    # Pattern includes: id, title, address, work_time, phone_number, lat, lon
-                    store_pattern = r'\{"id":(\d+),"title":"([^"]+)","address":"([^"]+)","work_time":"([^"]+)","phone_number":"([^"]+)","lat":"([^"]+)","lon":"([^"]+)"[^}]*\}'
+                    # Collapse escaped backslashes once for the whole chunk rather than per field
+                    data_str = data_str.replace('\\\\', '\\')
 
-                    store_matches = re.finditer(store_pattern, data_str)
+                    # Look for store objects pattern with coordinates
+                    store_matches = _STORE_RE.finditer(data_str)
 
                     for store_match in store_matches:
-                        # Extract escaped characters
-                        name = store_match.group(2).replace('\\\\', '\\')
-                        address = store_match.group(3).replace('\\\\', '\\')
-                        hours = store_match.group(4).replace('\\\\', '\\')
-                        phone = store_match.group(5).replace('\\\\', '\\')
-                        latitude = store_match.group(6)
-                        longitude = store_match.group(7)
+                        _, name, address, hours, phone, latitude, longitude = store_match.groups()
 
                         branch_data = {
                             'name': name,
@@ -91,21 +112,26 @@ def scrape_araz_locations(url: str = "https://arazmarket.az/az/stores") -> List[
                         }
 
                         # Check if we already have this store (avoid duplicates)
-                        if not any(s['name'] == name and s['address'] == address for s in stores_found):
+                        key = (name, address)
+                        if key not in seen:
+                            seen.add(key)
                             stores_found.append(branch_data)
 
         except Exception as e:
             # Skip chunks that can't be parsed
             continue
 
+    print(f"Scanned {chunks_scanned} data chunks")
+
     if stores_found:
         print(f"Successfully extracted {len(stores_found)} stores from streaming data")
-        for branch in stores_found:
-            branches.append(branch)
-            print(f"Extracted: {branch['name']}")
+        branches.extend(stores_found)
 
         return branches
 
+    # Only the fallbacks need the parsed DOM, so skip building it when the streaming data had the stores
+    soup = BeautifulSoup(page, 'lxml')
+
     # Look for __NEXT_DATA__ script tag as fallback
     next_data_script = soup.find('script', id='__NEXT_DATA__')
     if next_data_script:
@@ -134,13 +160,12 @@ def scrape_araz_locations(url: str = "https://arazmarket.az/az/stores") -> List[
 
                 for store in stores_data:
                     branch_data = {
-                        'name': store.get('name', store.get('title', 'N/A')),
-                        'address': store.get('address', store.get('location', '')),
-                        'phone': store.get('phone', store.get('tel', '')),
-                        'hours': store.get('hours', store.get('workingHours', store.get('working_hours', '')))
+                        'name': first_value(store, 'name', 'title') or 'N/A',
+                        'address': first_value(store, 'address', 'location'),
+                        'phone': first_value(store, 'phone', 'tel'),
+                        'hours': first_value(store, 'hours', 'workingHours', 'working_hours')
                     }
                     branches.append(branch_data)
-                    print(f"Extracted: {branch_data['name']}")
 
                 return branches
 
@@ -159,17 +184,16 @@ def scrape_araz_locations(url: str = "https://arazmarket.az/az/stores") -> List[
     for store_div in store_divs:
         try:
             # Find the accordion item
-            accordion = store_div.find('div', class_='accardion_accardionItem__Fyf_W')
+            accordion = _ACCORDION_SEL.select_one(store_div)
             if not accordion:
                 continue
 
             # Extract name from the title toggle
-            title_toggle = accordion.find('div', class_='accardion_accardionTitleToggle___WyGP')
-            name_span = title_toggle.find('span') if title_toggle else None
+            name_span = _TITLE_SEL.select_one(accordion)
             name = name_span.text.strip() if name_span else "N/A"
 
             # Find the content section
-            content = accordion.find('div', class_='accardion_accardionContent__Vlwtt')
+            content = _CONTENT_SEL.select_one(accordion)
             if not content:
                 continue
 
@@ -178,13 +202,13 @@ def scrape_araz_locations(url: str = "https://arazmarket.az/az/stores") -> List[
             address = address_p.text.strip() if address_p else ""
 
             # Extract phone and hours from the options div
-            options_div = content.find('div', class_='page_list_option__Cq36k')
+            options_div = _OPTIONS_SEL.select_one(content)
             phone = ""
             hours = ""
 
             if options_div:
                 # Extract phone
-                phone_link = options_div.find('a', href=lambda x: x and x.startswith('tel:'))
+                phone_link = _PHONE_SEL.select_one(options_div)
                 if phone_link:
                     phone = phone_link.text.strip()
 
@@ -201,7 +225,6 @@ def scrape_araz_locations(url: str = "https://arazmarket.az/az/stores") -> List[
             }
 
             branches.append(branch_data)
-            print(f"Extracted: {name}")
 
         except Exception as e:
             print(f"Error parsing branch: {e}")
@@ -210,32 +233,8 @@ def scrape_araz_locations(url: str = "https://arazmarket.az/az/stores") -> List[
     return branches
 
 
-def save_to_csv(branches: List[Dict[str, str]], output_file: str) -> None:
-    """
-    Save branch data to CSV file
-
-    Args:
-        branches: List of branch dictionaries
-        output_file: Path to output CSV file
-    """
-    if not branches:
-        print("No data to save")
-        return
-
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
-
-    fieldnames = ['name', 'address', 'phone', 'hours', 'latitude', 'longitude']
-
-    try:
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(branches)
-
-        print(f"\nSuccessfully saved {len(branches)} branches to {output_file}")
-    except Exception as e:
-        print(f"Error saving to CSV: {e}")
+# Write branches with this scraper's columns, in order
+save_to_csv = functools.partial(write_csv, fieldnames=['name', 'address', 'phone', 'hours', 'latitude', 'longitude'])
 
 
 def main():
@@ -4,11 +4,15 @@ Bravo Supermarket Web Scraper
 Extracts branch locations and details from bravosupermarket.az
 """
 
-import csv
-import requests
-from bs4 import BeautifulSoup
+import functools
+from collections import Counter
+from lxml import html
 from typing import List, Dict
-import os
+from _common import fetch_html, make_session, write_csv
+
+
+# One keep-alive session for every request this scraper makes
+_SESSION = make_session()
 
 
 def scrape_bravo_locations(url: str = "https://www.bravosupermarket.az/branches/") -> List[Dict[str, str]]:
@@ -21,34 +25,27 @@ def scrape_bravo_locations(url: str = "https://www.bravosupermarket.az/branches/
     Returns:
         List of dictionaries containing branch information
     """
-    print(f"Fetching data from {url}...")
-
-    try:
-        response = requests.get(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        response.raise_for_status()
-        response.encoding = 'utf-8'
-    except requests.RequestException as e:
-        print(f"Error fetching page: {e}")
+    page = fetch_html(_SESSION, url)
+    # lxml refuses to parse an empty document, so a blank page means no branches
+    if page is None or not page.strip():
         return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    tree = html.fromstring(page)
     branches = []
 
     # Find all branch articles
-    articles = soup.find_all('article', attrs={'data-lat': True, 'data-lng': True})
+    articles = tree.xpath('//article[@data-lat and @data-lng]')
 
     print(f"Found {len(articles)} branches")
 
     for article in articles:
         try:
             # Extract basic info
-            name_elem = article.find('h3')
-            name = name_elem.text.strip() if name_elem else "N/A"
+            name_elem = article.find('.//h3')
+            name = name_elem.text_content().strip() if name_elem is not None else "N/A"
 
-            # Extract all list items
-            list_items = article.find_all('li')
+            # Extract the list items that carry a span
+            list_items = article.xpath('.//li[.//span]')
 
             branch_type = ""
             phone = ""
@@ -56,20 +53,19 @@ def scrape_bravo_locations(url: str = "https://www.bravosupermarket.az/branches/
             hours = ""
 
             for li in list_items:
-                span = li.find('span')
-                if span:
-                    text = span.text.strip()
-
-                    # Determine what type of info this is
-                    if li.get('class') and 'location' in li.get('class'):
-                        if not branch_type and text in ['Hiper', 'Super', 'Market', 'Ekspres', 'Premium']:
-                            branch_type = text
-                        else:
-                            address = text
-                    elif li.get('class') and 'phone' in li.get('class'):
-                        phone = text
-                    elif li.get('class') and 'time' in li.get('class'):
-                        hours = text
+                text = li.find('.//span').text_content().strip()
+                li_classes = (li.get('class') or '').split()
+
+                # Determine what type of info this is
+                if 'location' in li_classes:
+                    if not branch_type and text in ['Hiper', 'Super', 'Market', 'Ekspres', 'Premium']:
+                        branch_type = text
+                    else:
+                        address = text
+                elif 'phone' in li_classes:
+                    phone = text
+                elif 'time' in li_classes:
+                    hours = text
 
             # Extract coordinates
             latitude = article.get('data-lat', '0')
@@ -91,9 +87,9 @@ def scrape_bravo_locations(url: str = "https://www.bravosupermarket.az/branches/
 
             # Extract Google Maps link
             google_maps_link = ""
-            maps_link = article.find('a', class_='google-maps-link')
+            maps_link = article.xpath('.//a[contains(concat(" ", normalize-space(@class), " "), " google-maps-link ")]')
             if maps_link:
-                google_maps_link = maps_link.get('href', '')
+                google_maps_link = maps_link[0].get('href', '')
 
             branch_data = {
                 'name': name,
@@ -108,7 +104,6 @@ def scrape_bravo_locations(url: str = "https://www.bravosupermarket.az/branches/
             }
 
             branches.append(branch_data)
-            print(f"Extracted: {name} ({branch_type})")
 
         except Exception as e:
             print(f"Error parsing branch: {e}")
@@ -117,32 +112,8 @@ def scrape_bravo_locations(url: str = "https://www.bravosupermarket.az/branches/
     return branches
 
 
-def save_to_csv(branches: List[Dict[str, str]], output_file: str) -> None:
-    """
-    Save branch data to CSV file
-
-    Args:
-        branches: List of branch dictionaries
-        output_file: Path to output CSV file
-    """
-    if not branches:
-        print("No data to save")
-        return
-
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
-
-    fieldnames = ['name', 'type', 'phone', 'address', 'hours', 'latitude', 'longitude', 'category_id', 'google_maps_url']
-
-    try:
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(branches)
-
-        print(f"\nSuccessfully saved {len(branches)} branches to {output_file}")
-    except Exception as e:
-        print(f"Error saving to CSV: {e}")
+# Write branches with this scraper's columns, in order
+save_to_csv = functools.partial(write_csv, fieldnames=['name', 'type', 'phone', 'address', 'hours', 'latitude', 'longitude', 'category_id', 'google_maps_url'])
 
 
 def main():
@@ -165,10 +136,7 @@ def main():
         print(f"Total branches: {len(branches)}")
 
         # Count by type
-        type_counts = {}
-        for branch in branches:
-            branch_type = branch['type'] or 'Unknown'
-            type_counts[branch_type] = type_counts.get(branch_type, 0) + 1
+        type_counts = Counter(branch['type'] or 'Unknown' for branch in branches)
 
         print("\nBranches by type:")
         for branch_type, count in sorted(type_counts.items()):
@@ -6,31 +6,41 @@ Merges all supermarket chain data into a single dataset for analysis
 
 import csv
 import os
-from typing import List, Dict
+from collections import Counter
+from typing import Dict, Iterator, List
 
 
-def combine_supermarket_data(
-    input_files: List[str],
-    output_file: str = 'data/combined.csv'
-) -> None:
+def _read_headers(input_files: List[str]) -> Dict[str, List[str]]:
     """
-    Combine multiple supermarket CSV files into one dataset
+    Read the header row of each input CSV that exists
 
     Args:
         input_files: List of CSV file paths to combine
-        output_file: Path to output combined CSV file
-    """
-    combined_data = []
 
-    print("=" * 60)
-    print("Combining Supermarket Chain Data")
-    print("=" * 60)
+    Returns:
+        Header fields of each readable file, keyed by path in input order
+    """
+    headers = {}
 
     for file_path in input_files:
-        if not os.path.exists(file_path):
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                headers[file_path] = next(csv.reader(f), [])
+        except FileNotFoundError:
             print(f"Warning: {file_path} not found, skipping...")
-            continue
 
+    return headers
+
+
+def _iter_rows(input_files: List[str], chain_counts: Counter) -> Iterator[Dict[str, str]]:
+    """
+    Stream the rows of each CSV tagged with its chain, counting stores per chain as they pass
+
+    Args:
+        input_files: List of CSV file paths to read
+        chain_counts: Store count per chain, updated in place
+    """
+    for file_path in input_files:
         # Extract chain name from filename
         chain_name = os.path.basename(file_path).replace('.csv', '').upper()
 
@@ -43,17 +53,34 @@ def combine_supermarket_data(
             for row in reader:
                 # Add chain identifier to each row
                 row['chain'] = chain_name
-                combined_data.append(row)
                 count += 1
+                yield row
 
+            chain_counts[chain_name] += count
             print(f"  Added {count} stores from {chain_name}")
 
+
+def combine_supermarket_data(
+    input_files: List[str],
+    output_file: str = 'data/combined.csv'
+) -> None:
+    """
+    Combine multiple supermarket CSV files into one dataset
+
+    Args:
+        input_files: List of CSV file paths to combine
+        output_file: Path to output combined CSV file
+    """
+    print("=" * 60)
+    print("Combining Supermarket Chain Data")
+    print("=" * 60)
+
+    # Every row carries exactly its file's header fields, so the headers alone give the output columns
+    headers = _read_headers(input_files)
+
     # Write combined data
-    if combined_data:
-        # Collect all unique fieldnames from all rows
-        all_fields = set()
-        for row in combined_data:
-            all_fields.update(row.keys())
+    if headers:
+        all_fields = set().union(*headers.values())
 
         # Order fieldnames: chain first, then common fields, then extras
         common_fields = ['chain', 'name', 'address', 'phone', 'hours', 'latitude', 'longitude']
@@ -62,32 +89,44 @@ def combine_supermarket_data(
 
         print(f"\nWriting combined data to {output_file}...")
 
-        with open(output_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(combined_data)
-
-        print(f"Successfully combined {len(combined_data)} stores into {output_file}")
+        # Rows are written as they are read, so the combined dataset is never held in memory.
+        # They go to a temporary file first, so the existing output survives inputs with no rows
+        tmp_file = output_file + '.tmp'
+        chain_counts = Counter()
+        try:
+            with open(tmp_file, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows([row.get(field, '') for field in fieldnames]
+                                 for row in _iter_rows(list(headers), chain_counts))
+        except BaseException:
+            # Leave no partial file behind; the existing output is untouched
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+            raise
+
+        total = sum(chain_counts.values())
+        if not total:
+            os.remove(tmp_file)
+            print("\nNo data to combine")
+            return
+
+        os.replace(tmp_file, output_file)
+        print(f"Successfully combined {total} stores into {output_file}")
 
         # Print summary by chain
         print("\n" + "=" * 60)
         print("Summary by Chain:")
         print("=" * 60)
 
-        chain_counts = {}
-        for row in combined_data:
-            chain = row['chain']
-            chain_counts[chain] = chain_counts.get(chain, 0) + 1
-
         for chain, count in sorted(chain_counts.items()):
             print(f"  {chain}: {count} stores")
 
-        print(f"\n  TOTAL: {len(combined_data)} stores")
+        print(f"\n  TOTAL: {total} stores")
         print("=" * 60)
     else:
         print("\nNo data to combine")
 
-
 def main():
     """Main execution function"""
     input_files = [
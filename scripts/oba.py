@@ -4,11 +4,14 @@ OBA Supermarket Web Scraper
 Extracts branch locations and details from oba.az
 """
 
-import csv
-import requests
+import functools
 from bs4 import BeautifulSoup
 from typing import List, Dict
-import os
+from _common import fetch_html, make_session, write_csv
+
+
+# One keep-alive session for every request this scraper makes
+_SESSION = make_session()
 
 
 def scrape_oba_locations(url: str = "https://oba.az/branches/") -> List[Dict[str, str]]:
@@ -21,19 +24,11 @@ def scrape_oba_locations(url: str = "https://oba.az/branches/") -> List[Dict[str
     Returns:
         List of dictionaries containing branch information
     """
-    print(f"Fetching data from {url}...")
-
-    try:
-        response = requests.get(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        response.raise_for_status()
-        response.encoding = 'utf-8'
-    except requests.RequestException as e:
-        print(f"Error fetching page: {e}")
+    page = fetch_html(_SESSION, url)
+    if page is None:
         return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(page, 'lxml')
     branches = []
 
     print("\nExtracting store data from HTML...")
@@ -71,7 +66,6 @@ def scrape_oba_locations(url: str = "https://oba.az/branches/") -> List[Dict[str
             }
 
             branches.append(branch_data)
-            print(f"Extracted: {name}")
 
         except Exception as e:
             print(f"Error parsing branch: {e}")
@@ -80,32 +74,8 @@ def scrape_oba_locations(url: str = "https://oba.az/branches/") -> List[Dict[str
     return branches
 
 
-def save_to_csv(branches: List[Dict[str, str]], output_file: str) -> None:
-    """
-    Save branch data to CSV file
-
-    Args:
-        branches: List of branch dictionaries
-        output_file: Path to output CSV file
-    """
-    if not branches:
-        print("No data to save")
-        return
-
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
-
-    fieldnames = ['name', 'address', 'phone', 'hours', 'latitude', 'longitude']
-
-    try:
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(branches)
-
-        print(f"\nSuccessfully saved {len(branches)} branches to {output_file}")
-    except Exception as e:
-        print(f"Error saving to CSV: {e}")
+# Write branches with this scraper's columns, in order
+save_to_csv = functools.partial(write_csv, fieldnames=['name', 'address', 'phone', 'hours', 'latitude', 'longitude'])
 
 
 def main():
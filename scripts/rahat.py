@@ -4,15 +4,23 @@ Rahat Market Web Scraper
 Extracts branch locations and details from rahatmarket.az
 """
 
-import csv
-import requests
-from bs4 import BeautifulSoup
-from typing import List, Dict
-import os
+import functools
+from typing import List
 import re
+from _common import Branch, fetch_html, make_session, write_csv
 
 
-def scrape_rahat_locations(url: str = "https://rahatmarket.az/az/map") -> List[Dict[str, str]]:
+# One keep-alive session for every request this scraper makes
+_SESSION = make_session()
+
+# Location entries: [new google.maps.LatLng(lat, lng), 'name', '<a ...>address</a>']
+# The address anchor is optional, so one pass finds entries with and without it (group 4 is None when absent)
+_LOCATION_RE = re.compile(r'\[new google\.maps\.LatLng\(([\d.]+),\s*([\d.]+)\),\s*["\']([^"\']+)["\'](?:,\s*["\']<a[^>]*>([^<]+)</a>["\'])?')
+
+_PAREN_ADDRESS_RE = re.compile(r'Rahat Market\s*\(([^)]*)\)')
+
+
+def scrape_rahat_locations(url: str = "https://rahatmarket.az/az/map") -> List[Branch]:
     """
     Scrape Rahat market branch locations
 
@@ -20,111 +28,80 @@ def scrape_rahat_locations(url: str = "https://rahatmarket.az/az/map") -> List[D
         url: URL of the Rahat stores map page
 
     Returns:
-        List of dictionaries containing branch information
+        List of Branch tuples
     """
-    print(f"Fetching data from {url}...")
-
-    try:
-        response = requests.get(url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
-        response.raise_for_status()
-        response.encoding = 'utf-8'
-    except requests.RequestException as e:
-        print(f"Error fetching page: {e}")
+    page = fetch_html(_SESSION, url)
+    if page is None:
         return []
 
-    soup = BeautifulSoup(response.text, 'html.parser')
     branches = []
 
     print("\nExtracting store data from JavaScript...")
 
-    # Find all script tags and look for the locations array
-    scripts = soup.find_all('script')
-
-    for script in scripts:
-        if script.string and 'var locations' in script.string:
-            script_content = script.string
-
-            # Extract the locations array using regex
-            # The JavaScript structure is: [new google.maps.LatLng(lat, lng), 'name', '<a ...>address</a>']
-            # We need to extract all three parts
-
-            # First, try to match the complete pattern with both name and address
-            # The name is in the second position, address is inside the anchor tag
-            full_pattern = r'\[new google\.maps\.LatLng\(([\d.]+),\s*([\d.]+)\),\s*["\']([^"\']+)["\'],\s*["\']<a[^>]*>([^<]+)</a>["\']'
-
-            full_matches = re.findall(full_pattern, script_content, re.DOTALL)
-
-            print(f"Found {len(full_matches)} stores with full details (name + address)")
-
-            if full_matches:
-                for match in full_matches:
-                    latitude = match[0]
-                    longitude = match[1]
-                    name = match[2].replace('\\', '').strip()
-                    address = match[3].replace('\\', '').strip()
-
-                    branch_data = {
-                        'name': name if name else 'Rahat Market',
-                        'address': address,
-                        'phone': '',
-                        'hours': '',
-                        'latitude': latitude,
-                        'longitude': longitude
-                    }
-
-                    branches.append(branch_data)
-                    print(f"Extracted: {name}")
-            else:
-                # Fallback: extract just coordinates and names
-                print("Full pattern didn't match, trying name-only pattern...")
-                name_pattern = r'\[new google\.maps\.LatLng\(([\d.]+),\s*([\d.]+)\),\s*["\']([^"\']+)["\']'
-
-                name_matches = re.findall(name_pattern, script_content)
-                print(f"Found {len(name_matches)} stores with name pattern")
-
-                for match in name_matches:
-                    latitude = match[0]
-                    longitude = match[1]
-                    text = match[2].replace('\\', '').strip()
-
-                    # Separate name and address
-                    # Format: "Rahat Market (address)" or just "address"
-                    name = 'Rahat Market'
-                    address = ''
-
-                    if text.startswith('Rahat Market'):
-                        # Extract content from parentheses if present
-                        paren_match = re.search(r'Rahat Market\s*\(([^)]*)\)', text)
-                        if paren_match:
-                            address = paren_match.group(1).strip()
-                        else:
-                            # No parentheses, might have trailing text
-                            address = text.replace('Rahat Market', '').strip()
+    # Locate the script holding the locations array straight in the raw HTML; no DOM is needed for it
+    script_content = None
+    locations_at = page.find('var locations')
+    if locations_at != -1:
+        script_end = page.find('</script>', locations_at)
+        script_content = page[locations_at:script_end if script_end != -1 else len(page)]
+
+    if script_content is not None:
+        # Extract the locations array using regex
+        # The JavaScript structure is: [new google.maps.LatLng(lat, lng), 'name', '<a ...>address</a>']
+        # We need to extract all three parts
+
+        # One scan collects every entry; those with the address anchor carry both name and address
+        # The name is in the second position, address is inside the anchor tag
+        matches = _LOCATION_RE.findall(script_content)
+        full_matches = [match for match in matches if match[3]]
+
+        print(f"Found {len(full_matches)} stores with full details (name + address)")
+
+        if full_matches:
+            for match in full_matches:
+                latitude = match[0]
+                longitude = match[1]
+                name = match[2].replace('\\', '').strip()
+                address = match[3].replace('\\', '').strip()
+
+                branches.append(Branch(name if name else 'Rahat Market', address, '', '', latitude, longitude))
+        else:
+            # Fallback: extract just coordinates and names
+            print("Full pattern didn't match, using name-only entries...")
+            print(f"Found {len(matches)} stores with name pattern")
+
+            for match in matches:
+                latitude = match[0]
+                longitude = match[1]
+                text = match[2].replace('\\', '').strip()
+
+                # Separate name and address
+                # Format: "Rahat Market (address)" or just "address"
+                name = 'Rahat Market'
+                address = ''
+
+                if text.startswith('Rahat Market'):
+                    # Extract content from parentheses if present
+                    paren_match = _PAREN_ADDRESS_RE.search(text)
+                    if paren_match:
+                        address = paren_match.group(1).strip()
                     else:
-                        # Text doesn't start with "Rahat Market", use it as address
-                        address = text
+                        # No parentheses, might have trailing text
+                        address = text.replace('Rahat Market', '').strip()
+                else:
+                    # Text doesn't start with "Rahat Market", use it as address
+                    address = text
 
-                    branch_data = {
-                        'name': name,
-                        'address': address,
-                        'phone': '',
-                        'hours': '',
-                        'latitude': latitude,
-                        'longitude': longitude
-                    }
-
-                    branches.append(branch_data)
-                    print(f"Extracted: {name} - {address[:50]}{'...' if len(address) > 50 else ''}")
-
-            break
+                branches.append(Branch(name, address, '', '', latitude, longitude))
 
     if not branches:
         print("\nWarning: Could not find location data in JavaScript")
         print("Attempting alternative extraction methods...")
 
-        # Try to find marker links as fallback
+        # Try to find marker links as fallback; only this path needs the parsed DOM, so bs4 is imported here
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(page, 'lxml')
         marker_links = soup.find_all('a', class_='marker-link')
         print(f"Found {len(marker_links)} marker links")
 
@@ -133,47 +110,13 @@ def scrape_rahat_locations(url: str = "https://rahatmarket.az/az/map") -> List[D
             marker_id = link.get('data-markerid', '')
 
             if name and name != 'Rahat Market':
-                branch_data = {
-                    'name': name,
-                    'address': '',
-                    'phone': '',
-                    'hours': '',
-                    'latitude': '',
-                    'longitude': ''
-                }
-
-                branches.append(branch_data)
-                print(f"Extracted: {name}")
+                branches.append(Branch(name, '', '', '', '', ''))
 
     return branches
 
 
-def save_to_csv(branches: List[Dict[str, str]], output_file: str) -> None:
-    """
-    Save branch data to CSV file
-
-    Args:
-        branches: List of branch dictionaries
-        output_file: Path to output CSV file
-    """
-    if not branches:
-        print("No data to save")
-        return
-
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
-
-    fieldnames = ['name', 'address', 'phone', 'hours', 'latitude', 'longitude']
-
-    try:
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(branches)
-
-        print(f"\nSuccessfully saved {len(branches)} branches to {output_file}")
-    except Exception as e:
-        print(f"Error saving to CSV: {e}")
+# Write branches with this scraper's columns, in order
+save_to_csv = functools.partial(write_csv, fieldnames=Branch._fields)
 
 
 def main():
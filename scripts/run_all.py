@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Scrape All Chains
+Runs every chain scraper concurrently, then combines their CSVs into one dataset
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Tuple
+
+import araz
+import bravo
+import oba
+import rahat
+import tam
+from combine import combine_supermarket_data
+
+
+# (chain, scraper, save_to_csv, output file); the order is also combine.py's input order
+SCRAPERS: List[Tuple[str, Callable[[], List], Callable, str]] = [
+    ('BRAVO', bravo.scrape_bravo_locations, bravo.save_to_csv, 'data/bravo.csv'),
+    ('ARAZ', araz.scrape_araz_locations, araz.save_to_csv, 'data/araz.csv'),
+    ('RAHAT', rahat.scrape_rahat_locations, rahat.save_to_csv, 'data/rahat.csv'),
+    ('OBA', oba.scrape_oba_locations, oba.save_to_csv, 'data/oba.csv'),
+    ('TAM', tam.scrape_tam_locations, tam.save_to_csv, 'data/tam.csv'),
+]
+
+
+def main():
+    """Main execution function"""
+    print("=" * 60)
+    print("Scraping All Supermarket Chains")
+    print("=" * 60)
+
+    # The fetches are network-bound, so threads overlap them and the total wait is the slowest site
+    with ThreadPoolExecutor(max_workers=len(SCRAPERS)) as ex:
+        futures = [ex.submit(scrape) for _, scrape, _, _ in SCRAPERS]
+
+        for (chain, _, save_to_csv, output_file), future in zip(SCRAPERS, futures):
+            try:
+                branches = future.result()
+            except Exception as e:
+                print(f"\nError scraping {chain}: {e}, keeping the existing {output_file}")
+                continue
+
+            if branches:
+                save_to_csv(branches, output_file)
+            else:
+                print(f"\nNo {chain} branches found, keeping the existing {output_file}")
+
+    combine_supermarket_data([output_file for _, _, _, output_file in SCRAPERS])
+
+
+if __name__ == "__main__":
+    main()
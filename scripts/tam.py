@@ -4,13 +4,40 @@ TAM Store Web Scraper
 Extracts branch locations and details from tamstore.az API
 """
 
-import csv
+import functools
+import json
 import requests
-from typing import List, Dict
-import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
 import re
 from html import unescape
 from urllib.parse import unquote
+from _common import Branch, make_session, write_csv
+
+
+# One keep-alive session for this scraper's own requests
+_SESSION = make_session()
+
+# Short-link resolver threads each keep their own session; requests.Session is not thread-safe
+_RESOLVER = threading.local()
+
+# DMS coordinates, e.g. 40°22'34.8"N 47°07'33.2"E or 40%C2%B022'34.8%22N
+_DMS_RE = re.compile(r"(\d+)[°%C2%B0]+(\d+)'([\d.]+)[\"'%22]+([NS])[^\d]*(\d+)[°%C2%B0]+(\d+)'([\d.]+)[\"'%22]+([EW])")
+
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Coordinates in Google Maps URLs: ?q=lat,lng, or !3d{lat} and !2d{lng} in iframe embeds
+_Q_COORD_RE = re.compile(r'[?&]q=([-\d.]+),([-\d.]+)')
+# Standard embed order, !2d{lng} immediately followed by !3d{lat}, found in one scan
+_EMBED_RE = re.compile(r'!2d([-\d.]+)!3d([-\d.]+)')
+_LAT3D_RE = re.compile(r'!3d([-\d.]+)')
+_LNG2D_RE = re.compile(r'!2d([-\d.]+)')
+
+# Common keys that might wrap the branch list in the API response,
+# in priority order, so the chosen list does not depend on the server's key order
+_BRANCH_KEY_ORDER = ('data', 'branches', 'stores', 'locations', 'items', 'results', 'payload')
+_BRANCH_KEYS = frozenset(_BRANCH_KEY_ORDER)
 
 
 def dms_to_decimal(dms_str: str) -> tuple:
@@ -24,10 +51,7 @@ def dms_to_decimal(dms_str: str) -> tuple:
         Tuple of (latitude, longitude) as strings
     """
     try:
-        # Pattern to extract DMS coordinates
-        # Example: 40°22'34.8"N 47°07'33.2"E or 40%C2%B022'34.8%22N
-        pattern = r"(\d+)[°%C2%B0]+(\d+)'([\d.]+)[\"'%22]+([NS])[^\d]*(\d+)[°%C2%B0]+(\d+)'([\d.]+)[\"'%22]+([EW])"
-        match = re.search(pattern, dms_str)
+        match = _DMS_RE.search(dms_str)
 
         if match:
             lat_deg, lat_min, lat_sec, lat_dir = match.group(1, 2, 3, 4)
@@ -50,7 +74,137 @@ def dms_to_decimal(dms_str: str) -> tuple:
     return ('', '')
 
 
-def scrape_tam_locations(api_url: str = "https://www.tamstore.az/api/branch-api") -> List[Dict[str, str]]:
+def expand_short_url(url: str) -> str:
+    """
+    Follow a shortened Google Maps link to its full URL
+
+    Args:
+        url: Shortened URL like "https://maps.app.goo.gl/..."
+
+    Returns:
+        The URL the link redirects to, or the link itself if it cannot be resolved
+    """
+    session = getattr(_RESOLVER, 'session', None)
+    if session is None:
+        session = _RESOLVER.session = make_session()
+
+    try:
+        return session.head(url, allow_redirects=True, timeout=5).url
+    except Exception:
+        return url
+
+
+def find_branch_list(data, depth: int = 2) -> Optional[list]:
+    """
+    Find the branch list in an API response, descending through wrapper dicts
+
+    Args:
+        data: Parsed JSON, e.g. [...], {'data': [...]} or {'data': {'items': [...]}}
+        depth: How many levels of wrapper dicts to descend through
+
+    Returns:
+        The first non-empty list found under a known key, or None
+    """
+    if isinstance(data, list):
+        return data
+
+    # Dicts without any known key (such as a single branch object) are ruled out in one set check
+    if isinstance(data, dict) and depth and not _BRANCH_KEYS.isdisjoint(data):
+        for key in _BRANCH_KEY_ORDER:
+            if key in data:
+                found = find_branch_list(data[key], depth - 1)
+                if found:
+                    return found
+
+    return None
+
+
+@functools.lru_cache(maxsize=512)
+def extract_coordinates(map_data: str) -> tuple:
+    """
+    Extract coordinates from a branch's map field
+
+    Branches of one store often repeat the same map blob, so results are cached by the raw string.
+
+    Args:
+        map_data: Google Maps URL, iframe embed or DMS text
+
+    Returns:
+        Tuple of (latitude, longitude) as strings, empty if none were found
+    """
+    # Try to extract coordinates from different formats
+    # Format 1: Direct URL like "https://www.google.com/maps?q=41.09286117553711,45.365360260009766"
+    coord_match = _Q_COORD_RE.search(map_data)
+    if coord_match:
+        return coord_match.group(1, 2)
+
+    # Format 2: Iframe embed URL with coordinates in a different format
+    # Example: !1m17!1m12!1m3!1d3037.134160954774!2d49.960864976011635!3d40.428028071437765
+    # Look for pattern like !3d{lat} and !2d{lng}, adjacent in the usual case
+    embed_match = _EMBED_RE.search(map_data)
+    if embed_match:
+        return (embed_match.group(2), embed_match.group(1))
+
+    lat_match = _LAT3D_RE.search(map_data)
+    lng_match = _LNG2D_RE.search(map_data)
+    if lat_match and lng_match:
+        return (lat_match.group(1), lng_match.group(1))
+
+    # Format 3: DMS format (degrees, minutes, seconds)
+    # Example: 40°22'34.8"N 47°07'33.2"E or URL encoded version
+    lat, lon = dms_to_decimal(unquote(map_data))
+    if lat and lon:
+        return (lat, lon)
+
+    return ('', '')
+
+
+def parse_branch(branch: dict, expanded_urls: Dict[str, str]) -> Branch:
+    """
+    Build a Branch from one API branch object
+
+    Args:
+        branch: Branch object from the API response
+        expanded_urls: Short map links already resolved to their full URLs
+
+    Returns:
+        The parsed branch
+    """
+    # Extract name
+    name = branch.get('title', '')
+
+    # Extract and clean address (remove HTML tags)
+    address = branch.get('address', '')
+    if address:
+        # Remove HTML tags
+        address = _HTML_TAG_RE.sub('', address)
+        # Unescape HTML entities; most addresses have none, so skip the call without an '&'
+        if '&' in address:
+            address = unescape(address)
+        address = address.strip()
+
+    # Extract phone (use phone_1)
+    phone = branch.get('phone_1', '')
+
+    # Extract work hours
+    hours = branch.get('work_hours', '')
+
+    # Extract coordinates from map field
+    latitude = ''
+    longitude = ''
+    map_data = branch.get('map', '')
+
+    if map_data:
+        # Try to expand shortened Google Maps URLs first
+        if 'maps.app.goo.gl' in map_data or 'goo.gl' in map_data:
+            map_data = expanded_urls.get(map_data, map_data)
+
+        latitude, longitude = extract_coordinates(map_data)
+
+    return Branch(name, address, phone, hours, latitude, longitude)
+
+
+def scrape_tam_locations(api_url: str = "https://www.tamstore.az/api/branch-api") -> List[Branch]:
     """
     Scrape TAM Store branch locations from API
 
@@ -58,17 +212,15 @@ def scrape_tam_locations(api_url: str = "https://www.tamstore.az/api/branch-api"
         api_url: URL of the TAM Store API endpoint
 
     Returns:
-        List of dictionaries containing branch information
+        List of Branch tuples
     """
     print(f"Fetching data from {api_url}...")
 
     try:
-        response = requests.get(api_url, headers={
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
-            'Accept': 'application/json'
-        })
+        response = _SESSION.get(api_url, headers={'Accept': 'application/json'}, timeout=15)
         response.raise_for_status()
-        data = response.json()
+        # json.loads takes the raw bytes directly, skipping the str decode response.json() may do first
+        data = json.loads(response.content)
     except requests.RequestException as e:
         print(f"Error fetching API: {e}")
         return []
@@ -82,126 +234,35 @@ def scrape_tam_locations(api_url: str = "https://www.tamstore.az/api/branch-api"
 
     # The API should return a list or dict with branch data
     # Let's handle different possible response structures
-    branch_list = []
+    branch_list = find_branch_list(data)
 
-    if isinstance(data, list):
-        branch_list = data
-    elif isinstance(data, dict):
-        # Try common keys that might contain the branch list
-        for key in ['data', 'branches', 'stores', 'locations', 'items']:
-            if key in data:
-                branch_list = data[key]
-                break
-
-        # If still no list found, the dict itself might be the data
-        if not branch_list and data:
-            branch_list = [data]
+    # If still no list found, the dict itself might be the data
+    if not branch_list:
+        branch_list = [data] if isinstance(data, dict) and data else []
 
     print(f"Found {len(branch_list)} branches in API response")
 
+    # Expanding a short link is a network round trip, so resolve them all concurrently up front
+    short_urls = list({branch['map'] for branch in branch_list
+                       if isinstance(branch, dict) and isinstance(branch.get('map'), str) and 'goo.gl' in branch['map']})
+    with ThreadPoolExecutor(max_workers=8) as ex:
+        expanded_urls = dict(zip(short_urls, ex.map(expand_short_url, short_urls)))
+
     for branch in branch_list:
-        try:
-            # Extract name
-            name = branch.get('title', '')
-
-            # Extract and clean address (remove HTML tags)
-            address = branch.get('address', '')
-            if address:
-                # Remove HTML tags
-                address = re.sub(r'<[^>]+>', '', address)
-                # Unescape HTML entities
-                address = unescape(address).strip()
-
-            # Extract phone (use phone_1)
-            phone = branch.get('phone_1', '')
-
-            # Extract work hours
-            hours = branch.get('work_hours', '')
-
-            # Extract coordinates from map field
-            latitude = ''
-            longitude = ''
-            map_data = branch.get('map', '')
-
-            if map_data:
-                # Try to expand shortened Google Maps URLs first
-                if 'maps.app.goo.gl' in map_data or 'goo.gl' in map_data:
-                    try:
-                        # Follow redirect to get full URL
-                        redirect_response = requests.head(map_data, allow_redirects=True, timeout=5)
-                        map_data = redirect_response.url
-                    except:
-                        pass
-
-                # Try to extract coordinates from different formats
-                # Format 1: Direct URL like "https://www.google.com/maps?q=41.09286117553711,45.365360260009766"
-                coord_match = re.search(r'[?&]q=([-\d.]+),([-\d.]+)', map_data)
-                if coord_match:
-                    latitude = coord_match.group(1)
-                    longitude = coord_match.group(2)
-                else:
-                    # Format 2: Iframe embed URL with coordinates in a different format
-                    # Example: !1m17!1m12!1m3!1d3037.134160954774!2d49.960864976011635!3d40.428028071437765
-                    # Look for pattern like !3d{lat} and !2d{lng}
-                    lat_match = re.search(r'!3d([-\d.]+)', map_data)
-                    lng_match = re.search(r'!2d([-\d.]+)', map_data)
-                    if lat_match and lng_match:
-                        latitude = lat_match.group(1)
-                        longitude = lng_match.group(1)
-                    else:
-                        # Format 3: DMS format (degrees, minutes, seconds)
-                        # Example: 40°22'34.8"N 47°07'33.2"E or URL encoded version
-                        decoded_map = unquote(map_data)
-                        lat, lon = dms_to_decimal(decoded_map)
-                        if lat and lon:
-                            latitude = lat
-                            longitude = lon
-
-            branch_data = {
-                'name': name,
-                'address': address,
-                'phone': phone,
-                'hours': hours,
-                'latitude': latitude,
-                'longitude': longitude
-            }
-
-            branches.append(branch_data)
-            print(f"Extracted: {name}")
+        if not isinstance(branch, dict):
+            print(f"Skipping unexpected branch entry: {branch!r}")
+            continue
 
+        try:
+            branches.append(parse_branch(branch, expanded_urls))
         except Exception as e:
             print(f"Error parsing branch: {e}")
-            continue
 
     return branches
 
 
-def save_to_csv(branches: List[Dict[str, str]], output_file: str) -> None:
-    """
-    Save branch data to CSV file
-
-    Args:
-        branches: List of branch dictionaries
-        output_file: Path to output CSV file
-    """
-    if not branches:
-        print("No data to save")
-        return
-
-    # Ensure output directory exists
-    os.makedirs(os.path.dirname(output_file) if os.path.dirname(output_file) else '.', exist_ok=True)
-
-    fieldnames = ['name', 'address', 'phone', 'hours', 'latitude', 'longitude']
-
-    try:
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(branches)
-
-        print(f"\nSuccessfully saved {len(branches)} branches to {output_file}")
-    except Exception as e:
-        print(f"Error saving to CSV: {e}")
+# Write branches with this scraper's columns, in order
+save_to_csv = functools.partial(write_csv, fieldnames=Branch._fields)
 
 
 def main():